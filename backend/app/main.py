@@ -3,6 +3,8 @@ FastAPI backend for Agent Canvas.
 Provides export and chat endpoints powered by Microsoft Agent Framework.
 """
 import os
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,6 +19,7 @@ load_dotenv(dotenv_path=env_path, override=True)
 from .routers import export, chat, templates, generate, tools, playbooks, evaluations
 from .config import config
 from .middleware.token_logger import TokenCostMiddleware, get_token_logger
+from .services.tool_catalog import warm_tool_catalog
 
 # Validate configuration on startup
 try:
@@ -25,10 +28,19 @@ except ValueError as e:
     print(f"Configuration error: {e}")
     print("Please check your .env file and environment variables.")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm caches before serving so the first request doesn't pay for them."""
+    await asyncio.to_thread(warm_tool_catalog)
+    yield
+
+
 app = FastAPI(
     title="Agent Canvas Backend",
     description="MAF-powered backend for agent orchestration and export",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -15,6 +15,7 @@ class NodeData(BaseModel):
     subtype: Optional[str] = None
     description: Optional[str] = None
     strategy: Optional[str] = None
+    maxConcurrent: Optional[int] = None
     threadPolicy: Optional[str] = None
     kind: Optional[str] = None
 
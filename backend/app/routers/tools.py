@@ -1,7 +1,7 @@
 """Tool catalog endpoints."""
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from ..services.tool_catalog import get_tool_catalog, get_capability_bundles
+from ..services.tool_catalog import get_tool_catalog_json, get_capability_bundles_json
 
 router = APIRouter(tags=["tools"])
 
@@ -9,10 +9,15 @@ router = APIRouter(tags=["tools"])
 @router.get("/catalog")
 async def list_tool_catalog():
     """Return available tools and metadata for discovery UI."""
-    return {"items": get_tool_catalog()}
+    return _items_response(get_tool_catalog_json())
 
 
 @router.get("/bundles")
 async def list_tool_bundles():
     """Return curated capability bundles."""
-    return {"items": get_capability_bundles()}
+    return _items_response(get_capability_bundles_json())
+
+
+def _items_response(items_json: bytes) -> Response:
+    # Payloads are cached pre-encoded, so skip FastAPI's jsonable_encoder round-trip.
+    return Response(content=b'{"items":' + items_json + b"}", media_type="application/json")
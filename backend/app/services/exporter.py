@@ -13,7 +13,7 @@ from .project_validator import (
     HOSTED_TOOL_SUBTYPES,
     MCP_TOOL_SUBTYPES,
 )
-from .tool_catalog import get_tool_catalog
+from .tool_catalog import get_tool_catalog_index
 
 
 def create_export_zip(project: Union[Project, Dict[str, Any]]) -> bytes:
@@ -69,7 +69,7 @@ Tools: {tool_count}
 Provider: {provider}
 """, encoding="utf-8")
 
-        catalog_map = {item["subtype"]: item for item in get_tool_catalog()}
+        catalog_map = get_tool_catalog_index()
 
         _write_tool_manifest(
             nodes=nodes,
@@ -3,11 +3,36 @@ TeamManager - Orchestrates MAF agents using Sequential/Concurrent patterns and s
 Follows MAF orchestration patterns and streaming from run_stream.
 """
 import asyncio
-from typing import Dict, Any, AsyncIterator, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
 from .agent_factory import AgentFactory
 from .tool_factory import ToolFactory
 
+# Default cap on children a concurrent manager streams at the same time.
+DEFAULT_MAX_CONCURRENT_CHILDREN = 8
+# Upper bound applied to user-supplied concurrency settings.
+MAX_CONCURRENT_CHILDREN_LIMIT = 64
+
+# Distinguishes "attribute absent" from "attribute set to None" on stream updates.
+_MISSING = object()
+
+# Marks the end of a child's stream on the concurrent fan-in queue.
+_DONE = object()
+
+
+def _concurrency_setting(value: Any, default: int) -> int:
+    """Parse a concurrency setting, clamped to 1..MAX_CONCURRENT_CHILDREN_LIMIT.
+
+    Missing, zero or non-numeric values (e.g. "", "abc") fall back to ``default``.
+    """
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return min(max(parsed, 1), MAX_CONCURRENT_CHILDREN_LIMIT)
+
 
 class ExecutionUnit:
     """Small wrapper that normalizes metadata for execution targets."""
@@ -30,22 +55,20 @@ class AgentUnit(ExecutionUnit):
     def __init__(self, node: Dict[str, Any], team_manager: "TeamManager", agent: Any):
         super().__init__(node, team_manager, "agent")
         self.agent = agent
+        # The label never changes after construction, so build the bracketing
+        # notices once; _attach_context copies them before decorating.
+        self._start_event = {"type": "notice", "data": {"message": f"{self.label} starting execution"}}
+        self._end_event = {"type": "notice", "data": {"message": f"{self.label} finished"}}
 
     async def run_stream(self, message: str) -> AsyncIterator[Dict[str, Any]]:
-        yield self.team_manager._attach_context(
-            {"type": "notice", "data": {"message": f"{self.label} starting execution"}},
-            self.id,
-            self.label,
-        )
+        yield self.team_manager._attach_context(self._start_event, self.id, self.label)
 
-        async for event in self.team_manager._run_agent_stream(self.agent, message):
-            yield self.team_manager._attach_context(event, self.id, self.label)
+        attach = self.team_manager._attach_context
+        async for batch in self.team_manager._run_agent_stream(self.agent, message):
+            for event in batch:
+                yield attach(event, self.id, self.label)
 
-        yield self.team_manager._attach_context(
-            {"type": "notice", "data": {"message": f"{self.label} finished"}},
-            self.id,
-            self.label,
-        )
+        yield self.team_manager._attach_context(self._end_event, self.id, self.label)
 
 
 class ManagerUnit(ExecutionUnit):
@@ -62,6 +85,11 @@ class ManagerUnit(ExecutionUnit):
         self.children = children
         data = node.get("data") or {}
         self.strategy = data.get("strategy", "sequential").lower()
+        # Caps how many children stream at once under the concurrent strategy.
+        self.max_concurrent = _concurrency_setting(
+            data.get("maxConcurrent"), team_manager.max_concurrent_children
+        )
+        self._queue_pool: List[asyncio.Queue] = []
 
     async def run_stream(self, message: str) -> AsyncIterator[Dict[str, Any]]:
         yield self.team_manager._attach_context(
@@ -139,32 +167,63 @@ class ManagerUnit(ExecutionUnit):
                 self.label,
             )
 
-        queue: asyncio.Queue = asyncio.Queue()
-        sentinel = object()
+        if len(self.children) == 1:
+            # Nothing to interleave; skip the task/queue plumbing entirely.
+            async for event in self.children[0].run_stream(message):
+                yield self.team_manager._append_parent_context(event, self)
+            return
+
+        # Reuse a drained queue from a previous run when one is available. The
+        # bound applies backpressure to fast children while the consumer is slow.
+        queue = self._queue_pool.pop() if self._queue_pool else asyncio.Queue(
+            maxsize=len(self.children) * 4
+        )
+        limiter = asyncio.Semaphore(self.max_concurrent)
 
         async def pump(unit: ExecutionUnit) -> None:
             try:
-                async for child_event in unit.run_stream(message):
-                    await queue.put((unit, child_event))
+                async with limiter:
+                    async for child_event in unit.run_stream(message):
+                        await queue.put((unit, child_event))
+            except Exception as exc:
+                # Keep siblings running: a failing child must not tear down the group.
+                await queue.put((
+                    unit,
+                    self.team_manager._attach_context(
+                        {"type": "error", "data": {"message": str(exc)}}, unit.id, unit.label
+                    ),
+                ))
             finally:
-                await queue.put((unit, sentinel))
+                await queue.put((unit, _DONE))
 
-        tasks = [asyncio.create_task(pump(child)) for child in self.children]
-        remaining = len(tasks)
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(pump(child)) for child in self.children]
+            remaining = len(tasks)
 
-        try:
-            while remaining:
-                unit, payload = await queue.get()
-                if payload is sentinel:
-                    remaining -= 1
-                    continue
+            try:
+                while remaining:
+                    unit, payload = await queue.get()
+                    if payload is _DONE:
+                        remaining -= 1
+                        continue
+
+                    yield self.team_manager._append_parent_context(payload, self)
+            except GeneratorExit:
+                # Consumer stopped early; the finally block cancels the pumps and
+                # the group reaps them. Re-raising here would surface as a
+                # BaseExceptionGroup from aclose().
+                return
+            finally:
+                if remaining:
+                    # Drain before cancelling so every pump's final _DONE put fits
+                    # in the bounded queue instead of blocking the group forever.
+                    while not queue.empty():
+                        queue.get_nowait()
+                    for task in tasks:
+                        task.cancel()
 
-                yield self.team_manager._append_parent_context(payload, self)
-        finally:
-            for task in tasks:
-                if not task.done():
-                    task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if not remaining and queue.empty():
+            self._queue_pool.append(queue)
 
 
 class TeamManager:
@@ -179,6 +238,9 @@ class TeamManager:
         self.settings = project.get("settings", {})
         self.nodes = {n["id"]: n for n in self.graph.get("nodes", [])}
         self.edges = self.graph.get("edges", [])
+        self.max_concurrent_children = _concurrency_setting(
+            self.settings.get("maxConcurrentChildren"), DEFAULT_MAX_CONCURRENT_CHILDREN
+        )
 
         self.agent_node_ids = [
             node["id"] for node in self.graph.get("nodes", []) if node.get("kind") == "agent"
@@ -198,6 +260,8 @@ class TeamManager:
             default_provider=self.settings.get("defaultProvider", "openai"),
             default_model=self.settings.get("defaultModel", "gpt-4o-mini"),
         )
+        # One factory per team, so tool instances (and their state) aren't shared
+        # across projects; loaded tool modules are still shared process-wide.
         self.tool_factory = ToolFactory()
 
         self.agents = {}
@@ -208,6 +272,7 @@ class TeamManager:
         self.director_unit: Optional[ManagerUnit] = None
         self.root_manager_ids: List[str] = []
         self._incoming_index = self._build_incoming_index()
+        self._outgoing_index, self._children_by_source_kind = self._build_outgoing_indexes()
         self._built = False
 
     async def build(self):
@@ -284,29 +349,37 @@ class TeamManager:
 
         yield {"type": "notice", "data": {"message": "Execution complete"}}
 
-    async def _run_agent_stream(self, agent, message: str) -> AsyncIterator[Dict[str, Any]]:
+    async def _run_agent_stream(self, agent, message: str) -> AsyncIterator[List[Dict[str, Any]]]:
         """
         Run a single agent and stream events.
         Uses MAF run_stream pattern from azure_ai_basic.py streaming_example.
+
+        Yields one batch per update so callers can decorate every event an
+        update produces (delta plus tool calls) in a single pass.
         """
         try:
             async for update in agent.run_stream(message):
-                if hasattr(update, "delta") and update.delta:
-                    yield {"type": "text", "data": {"delta": str(update.delta)}}
-                if hasattr(update, "tool_calls") and update.tool_calls:
-                    for tool_call in update.tool_calls:
-                        yield {
+                batch: List[Dict[str, Any]] = []
+                delta = getattr(update, "delta", _MISSING)
+                tool_calls = getattr(update, "tool_calls", _MISSING)
+                if delta is not _MISSING and delta:
+                    batch.append({"type": "text", "data": {"delta": str(delta)}})
+                if tool_calls is not _MISSING and tool_calls:
+                    for tool_call in tool_calls:
+                        batch.append({
                             "type": "tool_call",
                             "data": {
                                 "name": getattr(tool_call, "name", "unknown"),
                                 "args": getattr(tool_call, "arguments", {}),
                             }
-                        }
-                if not hasattr(update, "delta") and not hasattr(update, "tool_calls"):
-                    yield {"type": "text", "data": {"delta": str(update)}}
+                        })
+                if delta is _MISSING and tool_calls is _MISSING:
+                    batch.append({"type": "text", "data": {"delta": str(update)}})
+                if batch:
+                    yield batch
 
         except Exception as e:
-            yield {"type": "error", "data": {"message": str(e)}}
+            yield [{"type": "error", "data": {"message": str(e)}}]
 
     async def _run_without_director(self, message: str) -> AsyncIterator[Dict[str, Any]]:
         """Fallback execution when a director node is not present."""
@@ -468,20 +541,36 @@ class TeamManager:
         return director_unit
 
     def _resolve_children(self, source_id: str, allowed_kinds: Optional[set]) -> List[str]:
-        results: List[str] = []
+        if not allowed_kinds:
+            return [target_id for target_id, _ in self._outgoing_index.get(source_id, ())]
+        if len(allowed_kinds) == 1:
+            (kind,) = allowed_kinds
+            return list(self._children_by_source_kind.get(source_id, {}).get(kind, ()))
+        # Multi-kind lookups walk the ordered edge list so sequential teams keep
+        # the member order drawn on the canvas.
+        return [
+            target_id
+            for target_id, kind in self._outgoing_index.get(source_id, ())
+            if kind in allowed_kinds
+        ]
+
+    def _build_outgoing_indexes(
+        self,
+    ) -> Tuple[Dict[str, List[Tuple[str, Optional[str]]]], Dict[str, Dict[Optional[str], List[str]]]]:
+        outgoing: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+        by_kind: Dict[str, Dict[Optional[str], List[str]]] = {}
         for edge in self.edges:
-            if edge.get("source") != source_id:
-                continue
-            target_id = edge.get("target")
-            if not target_id:
+            source = edge.get("source")
+            target = edge.get("target")
+            if not source or not target:
                 continue
-            target_node = self.nodes.get(target_id)
+            target_node = self.nodes.get(target)
             if not target_node:
                 continue
-            if allowed_kinds and target_node.get("kind") not in allowed_kinds:
-                continue
-            results.append(target_id)
-        return results
+            kind = target_node.get("kind")
+            outgoing.setdefault(source, []).append((target, kind))
+            by_kind.setdefault(source, {}).setdefault(kind, []).append(target)
+        return outgoing, by_kind
 
     def _build_incoming_index(self) -> Dict[str, List[str]]:
         incoming: Dict[str, List[str]] = {}
@@ -494,41 +583,40 @@ class TeamManager:
         return incoming
 
     def _copy_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        # Every event reaching here is produced by this module, so ``data`` is
+        # always a dict and ``context`` is either absent or a dict.
         cloned = dict(event)
-        if "data" in cloned and isinstance(cloned["data"], dict):
-            cloned["data"] = dict(cloned["data"])
-        if "context" in cloned and isinstance(cloned["context"], dict):
-            cloned["context"] = dict(cloned["context"])
+        cloned["data"] = dict(event["data"])
+        context = event.get("context")
+        cloned["context"] = dict(context) if context else {}
         return cloned
 
     def _attach_context(self, event: Dict[str, Any], unit_id: str, unit_label: str) -> Dict[str, Any]:
         cloned = self._copy_event(event)
-        context = cloned.get("context")
-        if not isinstance(context, dict):
-            context = {}
+        context = cloned["context"]
 
-        context.setdefault("unitId", unit_id)
-        context.setdefault("unitLabel", unit_label)
+        # Deeper units attach first; keep their identity when re-wrapped.
+        if "unitId" not in context:
+            context["unitId"] = unit_id
+        if "unitLabel" not in context:
+            context["unitLabel"] = unit_label
 
-        unit = self.execution_units.get(unit_id)
-        if unit:
-            context.setdefault("unitKind", unit.kind)
+        if "unitKind" not in context:
+            unit = self.execution_units.get(unit_id)
+            if unit:
+                context["unitKind"] = unit.kind
 
-        cloned["context"] = context
         return cloned
 
     def _append_parent_context(self, event: Dict[str, Any], parent_unit: ManagerUnit) -> Dict[str, Any]:
         cloned = self._copy_event(event)
-        context = cloned.get("context")
-        if not isinstance(context, dict):
-            context = {}
+        context = cloned["context"]
 
-        lineage = list(context.get("lineage", []))
+        lineage = list(context.get("lineage", ()))
         if parent_unit.id not in lineage:
             lineage.append(parent_unit.id)
         context["lineage"] = lineage
         context["via"] = parent_unit.id
         context["viaLabel"] = parent_unit.label
         context["viaKind"] = parent_unit.kind
-        cloned["context"] = context
         return cloned
@@ -1,18 +1,45 @@
 """Tool catalog service for surfacing available tools to the frontend."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import ast
+import json
+import os
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from .project_validator import HOSTED_TOOL_SUBTYPES, MCP_TOOL_SUBTYPES
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DELIVERABLE_TOOLS_DIR = BASE_DIR.parent / "deliverables" / "backend-python" / "tools"
 
+# Latest catalog build, reused while the tools directory signature matches;
+# see _tools_dir_signature.
+_CATALOG_CACHE: Optional["_CatalogSnapshot"] = None
+_CATALOG_LOCK = threading.Lock()
+
+# On-disk cache of AST-extracted module fields, keyed by path + size + mtime.
+# Bump _METADATA_CACHE_VERSION whenever _parse_module_fields changes its output.
+METADATA_CACHE_PATH = Path(
+    os.getenv(
+        "TOOL_METADATA_CACHE_PATH",
+        str(Path.home() / ".cache" / "cortex-grid" / "tool_meta.sqlite"),
+    )
+)
+_METADATA_CACHE_VERSION = 3
+_METADATA_CACHE_CONN: Optional[sqlite3.Connection] = None
+_METADATA_CACHE_DISABLED = False
+
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     subtype: str
     label: str
@@ -24,12 +51,27 @@ class ToolMetadata:
     source: Optional[str] = None  # deliverables path or framework identifier
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        # Remove None fields for lean payloads
-        return {k: v for k, v in data.items() if v not in (None, [], {})}
+        # Built field-by-field rather than via asdict(): no recursive copy, and
+        # unset optional fields are dropped for lean payloads.
+        data: Dict[str, Any] = {
+            "subtype": self.subtype,
+            "label": self.label,
+            "category": self.category,
+        }
+        if self.description is not None:
+            data["description"] = self.description
+        if self.module is not None:
+            data["module"] = self.module
+        if self.requires:
+            data["requires"] = self.requires
+        if self.sample_prompts:
+            data["sample_prompts"] = self.sample_prompts
+        if self.source is not None:
+            data["source"] = self.source
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class CapabilityBundle:
     id: str
     title: str
@@ -41,9 +83,27 @@ class CapabilityBundle:
     edges: List[Dict[str, Any]]
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        # Convert Path etc if needed (but nodes/edges already serializable)
-        return data
+        # nodes/edges are already JSON-ready literals, so share them instead of
+        # deep-copying through asdict().
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "category": self.category,
+            "tags": self.tags,
+            "summary": self.summary,
+            "nodes": self.nodes,
+            "edges": self.edges,
+        }
+
+
+# Module-level names whose list/tuple literal values feed catalog metadata.
+_PROMPT_NAMES = frozenset({"SAMPLE_PROMPTS", "EXAMPLE_PROMPTS"})
+_REQUIRES_NAMES = frozenset({"REQUIRES", "REQUIRED_SECRETS"})
+
+# Subtype sets are static, so sort them once rather than per catalog build.
+_SORTED_HOSTED_SUBTYPES = tuple(sorted(HOSTED_TOOL_SUBTYPES))
+_SORTED_MCP_SUBTYPES = tuple(sorted(MCP_TOOL_SUBTYPES))
 
 
 BUILT_IN_TOOL_OVERRIDES: Dict[str, Dict[str, Any]] = {
@@ -294,87 +354,206 @@ CAPABILITY_BUNDLES: List[CapabilityBundle] = [
 
 
 def get_tool_catalog() -> List[Dict[str, Any]]:
-    """Return tool metadata payload for the frontend."""
-    catalog: List[ToolMetadata] = []
+    """Return tool metadata payload for the frontend.
+
+    The payload is rebuilt only when a file under the deliverables tools
+    directory is added, removed, or modified; that rebuild runs in the
+    background while the previous payload keeps being served. The cached
+    list is returned as-is, so callers must treat it as read-only.
+    """
+    return _catalog_snapshot().items
+
+
+def get_tool_catalog_json() -> bytes:
+    """Return the tool catalog payload pre-encoded as JSON."""
+    return _catalog_snapshot().items_json
+
+
+def get_tool_catalog_index() -> Dict[str, Dict[str, Any]]:
+    """Return catalog entries keyed by subtype (read-only, shares the cached payload)."""
+    return _catalog_snapshot().by_subtype
+
+
+def resolve_tool(subtype: str) -> Optional[Dict[str, Any]]:
+    """Look up a single catalog entry by subtype."""
+    return _catalog_snapshot().by_subtype.get(subtype)
+
+
+class _CatalogSnapshot(NamedTuple):
+    signature: Tuple[Any, ...]
+    items: List[Dict[str, Any]]
+    items_json: bytes
+    by_subtype: Dict[str, Dict[str, Any]]
+
+
+def warm_tool_catalog() -> None:
+    """Build the catalog ahead of the first request (called from app startup)."""
+    _catalog_snapshot()
+
+
+def _catalog_snapshot() -> _CatalogSnapshot:
+    cached = _CATALOG_CACHE
+    if cached is not None:
+        if cached.signature != _tools_dir_signature():
+            # Serve the previous build while a background thread refreshes it.
+            _schedule_catalog_refresh()
+        return cached
+
+    with _CATALOG_LOCK:
+        if _CATALOG_CACHE is None:
+            _rebuild_catalog()
+        return _CATALOG_CACHE
+
+
+def _schedule_catalog_refresh() -> None:
+    # A held lock means a build is already under way; don't queue another.
+    if not _CATALOG_LOCK.acquire(blocking=False):
+        return
+    try:
+        threading.Thread(
+            target=_refresh_catalog_and_release, name="tool-catalog-refresh", daemon=True
+        ).start()
+    except RuntimeError:
+        _CATALOG_LOCK.release()
+
+
+def _refresh_catalog_and_release() -> None:
+    try:
+        _rebuild_catalog()
+    finally:
+        _CATALOG_LOCK.release()
+
+
+def _rebuild_catalog() -> None:
+    """Rebuild the snapshot; callers must hold _CATALOG_LOCK."""
+    global _CATALOG_CACHE
+
+    signature = _tools_dir_signature()
+    items = _build_tool_catalog()
+    _CATALOG_CACHE = _CatalogSnapshot(
+        signature=signature,
+        items=items,
+        items_json=_dumps(items),
+        by_subtype={item["subtype"]: item for item in items},
+    )
+
+
+def _tools_dir_signature() -> Tuple[Any, ...]:
+    """Cheap fingerprint of the tools directory: one stat per entry."""
+    entries = []
+    for entry in _scan_tools_dir():
+        try:
+            # Package tools are described by their __init__.py, so fingerprint that file.
+            if entry.is_dir():
+                stat = os.stat(os.path.join(entry.path, "__init__.py"))
+            else:
+                stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+def _scan_tools_dir() -> List[os.DirEntry]:
+    """List the tools directory sorted by name; DirEntry caches the file type.
+
+    Entries starting with ``_`` are shared helpers, not tools, and are skipped.
+    """
+    try:
+        with os.scandir(DELIVERABLE_TOOLS_DIR) as it:
+            return sorted((entry for entry in it if not entry.name.startswith("_")), key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def _build_tool_catalog() -> List[Dict[str, Any]]:
+    # Serialize each entry as it is built rather than collecting ToolMetadata
+    # objects and converting them in a second pass.
+    catalog: List[Dict[str, Any]] = []
 
     # Hosted tools (built into framework)
-    for subtype in sorted(HOSTED_TOOL_SUBTYPES):
-        override = BUILT_IN_TOOL_OVERRIDES.get(subtype, {})
+    for subtype in _SORTED_HOSTED_SUBTYPES:
         catalog.append(
-            ToolMetadata(
-                subtype=subtype,
-                label=override.get("label", subtype.replace("-", " ").title()),
-                category="hosted",
-                description=override.get("description"),
-                requires=override.get("requires"),
-                sample_prompts=override.get("sample_prompts"),
-                source="framework",
-            )
+            _metadata_from_override(subtype, "hosted", subtype.replace("-", " ").title()).to_dict()
         )
 
     # MCP tools
-    for subtype in sorted(MCP_TOOL_SUBTYPES):
-        override = BUILT_IN_TOOL_OVERRIDES.get(subtype, {})
-        catalog.append(
-            ToolMetadata(
-                subtype=subtype,
-                label=override.get("label", "MCP Tool"),
-                category="mcp",
-                description=override.get("description"),
-                requires=override.get("requires"),
-                sample_prompts=override.get("sample_prompts"),
-                source="framework",
-            )
-        )
+    for subtype in _SORTED_MCP_SUBTYPES:
+        catalog.append(_metadata_from_override(subtype, "mcp", "MCP Tool").to_dict())
 
     # Function tools shipped in deliverables
-    if DELIVERABLE_TOOLS_DIR.exists():
-        for tool_path in sorted(DELIVERABLE_TOOLS_DIR.iterdir()):
-            if tool_path.is_dir():
-                module_path = tool_path / "__init__.py"
-                if not module_path.exists():
-                    continue
-                subtype = tool_path.name.replace("_", "-")
-                catalog.append(_metadata_from_module(subtype, module_path))
-            elif tool_path.suffix == ".py":
-                subtype = tool_path.stem.replace("_", "-")
-                catalog.append(_metadata_from_module(subtype, tool_path))
+    for entry in _scan_tools_dir():
+        if entry.is_dir():
+            module_path = os.path.join(entry.path, "__init__.py")
+            if not os.path.exists(module_path):
+                continue
+            subtype = entry.name.replace("_", "-")
+            catalog.append(_metadata_from_module(subtype, Path(module_path)).to_dict())
+        elif entry.name.endswith(".py"):
+            subtype = entry.name[:-3].replace("_", "-")
+            catalog.append(_metadata_from_module(subtype, Path(entry.path)).to_dict())
 
-    # Return serialized dictionaries
-    return [tool.to_dict() for tool in catalog]
+    return catalog
 
 
-def get_capability_bundles() -> List[Dict[str, Any]]:
-    """Return curated capability bundles for marketplace UI."""
-    return [bundle.to_dict() for bundle in CAPABILITY_BUNDLES]
+def get_capability_bundles() -> List[Mapping[str, Any]]:
+    """Return curated capability bundles for marketplace UI (read-only views)."""
+    return list(_CAPABILITY_BUNDLES_SERIALIZED)
 
 
-def _metadata_from_module(subtype: str, module_path: Path) -> ToolMetadata:
-    """Extract metadata from a tool module."""
-    description = None
-    sample_prompts: Optional[List[str]] = None
-    requires: Optional[List[str]] = None
+def get_capability_bundles_json() -> bytes:
+    """Return the capability bundles pre-encoded as JSON."""
+    return _CAPABILITY_BUNDLES_JSON
 
-    try:
-        module_ast = ast.parse(module_path.read_text(encoding="utf-8"))
-        module_doc = ast.get_docstring(module_ast)
-        if module_doc:
-            first_line = module_doc.strip().splitlines()[0]
-            description = first_line
 
-        for node in module_ast.body:
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        if target.id in {"SAMPLE_PROMPTS", "EXAMPLE_PROMPTS"} and isinstance(node.value, (ast.List, ast.Tuple)):
-                            sample_prompts = [_literal_eval_str(elt) for elt in node.value.elts if _literal_eval_str(elt)]
-                if target.id in {"REQUIRES", "REQUIRED_SECRETS"} and isinstance(node.value, (ast.List, ast.Tuple)):
-                    requires = [_literal_eval_str(elt) for elt in node.value.elts if _literal_eval_str(elt)]
-    except Exception:
-        # If parsing fails we leave optional fields empty
-        description = description or "Custom tool module."
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default)
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
 
+def _json_default(value: Any) -> Any:
+    # Frozen bundle views are mappings, not dicts; neither encoder handles them natively.
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only proxies and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _metadata_from_override(subtype: str, category: str, default_label: str) -> ToolMetadata:
+    """Build metadata for a framework-provided tool from BUILT_IN_TOOL_OVERRIDES."""
+    override = BUILT_IN_TOOL_OVERRIDES.get(subtype, {})
+    return ToolMetadata(
+        subtype=subtype,
+        label=override.get("label", default_label),
+        category=category,
+        description=override.get("description"),
+        requires=override.get("requires"),
+        sample_prompts=override.get("sample_prompts"),
+        source="framework",
+    )
+
+
+def _metadata_from_module(subtype: str, module_path: Path) -> ToolMetadata:
+    """Extract metadata from a tool module."""
     override = FUNCTION_TOOL_OVERRIDES.get(subtype, {})
+    if "description" in override and "requires" in override and override.get("sample_prompts"):
+        # Curated overrides already supply every parsed field, so skip the file
+        # entirely. An explicit empty ``requires`` means "nothing required".
+        description, sample_prompts, requires = None, None, None
+    else:
+        description, sample_prompts, requires = _cached_module_fields(module_path)
+
     label = override.get("label", subtype.replace("-", " ").title())
     description = override.get("description", description)
     requires = override.get("requires") or requires
@@ -392,7 +571,137 @@ def _metadata_from_module(subtype: str, module_path: Path) -> ToolMetadata:
     )
 
 
-def _literal_eval_str(node: ast.AST) -> Optional[str]:
-    if isinstance(node, ast.Constant) and isinstance(node.value, str):
-        return node.value
-    return None
+def _parse_module_fields(
+    module_path: Path,
+) -> Tuple[Optional[str], Optional[List[str]], Optional[List[str]]]:
+    """Read description, sample prompts and requirements from a module's AST."""
+    description = None
+    sample_prompts: Optional[List[str]] = None
+    requires: Optional[List[str]] = None
+
+    try:
+        module_ast = ast.parse(
+            module_path.read_text(encoding="utf-8"),
+            filename=str(module_path),
+            mode="exec",
+            type_comments=False,
+        )
+        module_doc = ast.get_docstring(module_ast)
+        if module_doc:
+            first_line = module_doc.strip().splitlines()[0]
+            description = first_line
+
+        # Bind the node types once; this loop runs over every top-level statement.
+        assign_type = ast.Assign
+        name_type = ast.Name
+        constant_type = ast.Constant
+        sequence_types = (ast.List, ast.Tuple)
+
+        for node in module_ast.body:
+            if not isinstance(node, assign_type) or not isinstance(node.value, sequence_types):
+                continue
+            strings: Optional[List[str]] = None
+            for target in node.targets:
+                if not isinstance(target, name_type):
+                    continue
+                if target.id not in _PROMPT_NAMES and target.id not in _REQUIRES_NAMES:
+                    continue
+                if strings is None:
+                    strings = [
+                        elt.value
+                        for elt in node.value.elts
+                        if isinstance(elt, constant_type) and isinstance(elt.value, str) and elt.value
+                    ]
+                if target.id in _PROMPT_NAMES:
+                    sample_prompts = strings
+                else:
+                    requires = strings
+            if sample_prompts is not None and requires is not None:
+                # Both fields found; the rest of the module cannot contribute.
+                break
+    except Exception:
+        # If parsing fails we leave optional fields empty
+        description = description or "Custom tool module."
+
+    return description, sample_prompts, requires
+
+
+def _cached_module_fields(
+    module_path: Path,
+) -> Tuple[Optional[str], Optional[List[str]], Optional[List[str]]]:
+    """Return parsed module fields, reusing the on-disk cache when the file is unchanged."""
+    conn = _metadata_cache_connection()
+    if conn is None:
+        return _parse_module_fields(module_path)
+
+    try:
+        stat = module_path.stat()
+        key = str(module_path.resolve())
+        row = conn.execute(
+            "SELECT description, sample_prompts, requires FROM tool_meta "
+            "WHERE path = ? AND size = ? AND mtime_ns = ? AND version = ?",
+            (key, stat.st_size, stat.st_mtime_ns, _METADATA_CACHE_VERSION),
+        ).fetchone()
+        if row is not None:
+            return row[0], json.loads(row[1]), json.loads(row[2])
+
+        fields = _parse_module_fields(module_path)
+        description, sample_prompts, requires = fields
+        conn.execute(
+            "INSERT OR REPLACE INTO tool_meta "
+            "(path, size, mtime_ns, version, description, sample_prompts, requires) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                stat.st_size,
+                stat.st_mtime_ns,
+                _METADATA_CACHE_VERSION,
+                description,
+                json.dumps(sample_prompts),
+                json.dumps(requires),
+            ),
+        )
+        conn.commit()
+        return fields
+    except (OSError, sqlite3.Error, ValueError):
+        return _parse_module_fields(module_path)
+
+
+def _metadata_cache_connection() -> Optional[sqlite3.Connection]:
+    """Open the metadata cache once; returns None if the cache location is unusable."""
+    global _METADATA_CACHE_CONN, _METADATA_CACHE_DISABLED
+
+    if _METADATA_CACHE_CONN is not None or _METADATA_CACHE_DISABLED:
+        return _METADATA_CACHE_CONN
+
+    try:
+        METADATA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Only used while _CATALOG_LOCK is held, so sharing across threads is safe.
+        conn = sqlite3.connect(str(METADATA_CACHE_PATH), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tool_meta (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                version INTEGER NOT NULL,
+                description TEXT,
+                sample_prompts TEXT,
+                requires TEXT
+            )
+            """
+        )
+        conn.commit()
+    except (OSError, sqlite3.Error):
+        _METADATA_CACHE_DISABLED = True
+        return None
+
+    _METADATA_CACHE_CONN = conn
+    return conn
+
+
+# Bundles are static; serialize them once at import instead of per request.
+# The views are frozen so every caller can share them without defensive copies.
+_CAPABILITY_BUNDLES_SERIALIZED = tuple(_freeze(bundle.to_dict()) for bundle in CAPABILITY_BUNDLES)
+_CAPABILITY_BUNDLES_JSON = _dumps(list(_CAPABILITY_BUNDLES_SERIALIZED))
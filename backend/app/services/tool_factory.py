@@ -3,8 +3,13 @@ ToolFactory - Creates MAF tool instances from node specifications.
 Supports MCP, Hosted tools (code interpreter, file search, web search), and function tools.
 """
 import os
+import sys
+import json
 import logging
-from typing import Dict, Any, List, Callable, Optional
+import importlib.util
+from collections import OrderedDict
+from types import ModuleType
+from typing import Dict, Any, List, Callable, Optional, Tuple
 from pathlib import Path
 from agent_framework import (
     MCPStreamableHTTPTool,
@@ -14,16 +19,34 @@ from agent_framework import (
     HostedMCPTool,
 )
 
+# Parent name under which tool packages are registered in sys.modules.
+_TOOL_PACKAGE_PREFIX = "agent_studio_tools"
+
+# Upper bound on cached function tools across (subtype, config) combinations.
+FUNCTION_TOOL_CACHE_SIZE = 256
+
+# Configure logging once at import rather than on every factory construction.
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+
 
 class ToolFactory:
     """Factory for creating MAF tools from node specifications."""
     
     def __init__(self):
         self.tools_dir = Path(__file__).parent.parent.parent / "deliverables" / "tools"
-        self._function_tools_cache = {}
+        self._function_tools_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
         self.logger = logging.getLogger(__name__)
-        if not logging.getLogger().handlers:
-            logging.basicConfig(level=logging.INFO)
+        # Built-in subtypes dispatch through this table; anything else is looked
+        # up in the tools directory. Handlers take (node data, toolConfig).
+        self._builders: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Any]] = {
+            "mcp-tool": lambda data, config: self.build_mcp_tool(config),
+            "code-interpreter": lambda data, config: self.build_code_interpreter(),
+            "file-search": lambda data, config: self.build_file_search(config),
+            "google-search": lambda data, config: self.build_web_search(config),
+            "bing-search": lambda data, config: self.build_web_search(config),
+            "function": lambda data, config: self.build_function_tool(data),
+        }
     
     def build_tool(self, node: Dict[str, Any]) -> Any:
         """
@@ -39,19 +62,12 @@ class ToolFactory:
         subtype = data.get("subtype")
         config = data.get("toolConfig", {})
         
-        if subtype == "mcp-tool":
-            return self.build_mcp_tool(config)
-        elif subtype == "code-interpreter":
-            return self.build_code_interpreter()
-        elif subtype == "file-search":
-            return self.build_file_search(config)
-        elif subtype == "google-search" or subtype == "bing-search":
-            return self.build_web_search(config)
-        elif subtype == "function":
-            return self.build_function_tool(data)
-        else:
-            # Try to load from tools directory (yahoo-finance, etc.)
-            return self._build_function_tool_from_file(subtype, config)
+        builder = self._builders.get(subtype)
+        if builder is not None:
+            return builder(data, config)
+
+        # Try to load from tools directory (yahoo-finance, etc.)
+        return self._build_function_tool_from_file(subtype, config)
     
     def build_mcp_tool(self, config: Dict[str, Any]) -> MCPStreamableHTTPTool:
         """
@@ -103,97 +119,162 @@ class ToolFactory:
     def _build_function_tool_from_file(self, subtype: str, config: Dict[str, Any]) -> Optional[Callable]:
         """
         Build function tool from tools directory (yahoo-finance, etc.).
-        Uses same logic as deliverables: detects classes with as_tools() or functions.
+        Results are cached per (subtype, config) in a bounded LRU, so nodes with
+        different toolConfig values no longer share one instance.
         """
-        if subtype in self._function_tools_cache:
-            return self._function_tools_cache[subtype]
-        
-        # Try to import from tools directory
-        tool_file = self.tools_dir / f"{subtype.replace('-', '_')}.py"
-        tool_module_dir = self.tools_dir / subtype.replace('-', '_')
-        
-        tool_function = None
-        module = None
+        config_key = _config_cache_key(config)
+        if config_key is None:
+            # No stable key for this config; build a fresh tool every time.
+            return self._resolve_function_tool(subtype, config)
+        key = (subtype, config_key)
+        cache = self._function_tools_cache
+        tool = cache.get(key)
+        if tool is not None:
+            cache.move_to_end(key)
+            return tool
 
-        # Try file import
-        if tool_file.exists():
-            try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(subtype, tool_file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    self.logger.debug("Loaded tool module from file: %s", tool_file)
-            except Exception as e:
-                self.logger.warning("Failed to load tool %s from file: %s", subtype, e)
+        tool = self._resolve_function_tool(subtype, config)
+        if tool is not None:
+            cache[key] = tool
+            if len(cache) > FUNCTION_TOOL_CACHE_SIZE:
+                cache.popitem(last=False)
+        return tool
 
-        # Try module import
-        if module is None and tool_module_dir.exists() and (tool_module_dir / "__init__.py").exists():
-            try:
-                import sys
-                sys.path.insert(0, str(self.tools_dir))
-                module = __import__(subtype.replace('-', '_'))
-                sys.path.pop(0)
-                self.logger.debug("Imported tool module: %s", subtype)
-            except Exception as e:
-                self.logger.warning("Failed to load tool %s from module: %s", subtype, e)
+    def _resolve_function_tool(self, subtype: str, config: Dict[str, Any]) -> Optional[Callable]:
+        """
+        Resolve a function tool from its module.
+        Uses same logic as deliverables: detects classes with as_tools() or functions.
+        """
+        func_name = subtype.replace('-', '_')
+        tool_function = None
+        module = self._load_tool_module(subtype, func_name)
 
         # If we loaded a module, try to resolve common patterns
         if module is not None:
             try:
                 # 1) Look for a function matching the subtype name
-                func_name = subtype.replace('-', '_')
-                if hasattr(module, func_name):
-                    tool_function = getattr(module, func_name)
+                tool_function = getattr(module, func_name, None)
+                if tool_function is not None:
                     self.logger.info("Found function tool '%s' in module %s", func_name, subtype)
                 # 2) Look for a top-level 'main' function
-                elif hasattr(module, 'main'):
+                elif getattr(module, 'main', None) is not None:
                     tool_function = module.main
                     self.logger.info("Found 'main' function tool in module %s", subtype)
                 else:
-                    # 3) Look for classes ending with 'Tool' and instantiate them
-                    for attr_name in dir(module):
+                    # 3) Look for classes ending with 'Tool' and instantiate them.
+                    # Filter the module namespace directly; only the few candidates
+                    # are sorted, preserving the name order dir() used to give.
+                    candidates = sorted(
+                        (
+                            (attr_name, attr)
+                            for attr_name, attr in vars(module).items()
+                            if isinstance(attr, type) and attr_name.lower().endswith('tool')
+                        ),
+                        key=lambda item: item[0],
+                    )
+                    for attr_name, attr in candidates:
                         try:
-                            attr = getattr(module, attr_name)
-                        except Exception:
-                            continue
-                        if isinstance(attr, type) and attr_name.lower().endswith('tool'):
+                            # Try instantiation with no args
+                            instance = attr()
+                            self.logger.debug("Instantiated %s() for tool subtype %s", attr_name, subtype)
+                        except TypeError:
+                            # Try passing config as kwargs if available
                             try:
-                                # Try instantiation with no args
-                                instance = attr()
-                                self.logger.debug("Instantiated %s() for tool subtype %s", attr_name, subtype)
-                            except TypeError:
-                                # Try passing config as kwargs if available
-                                try:
-                                    instance = attr(**config) if isinstance(config, dict) else attr()
-                                    self.logger.debug("Instantiated %s(**config) for tool subtype %s", attr_name, subtype)
-                                except Exception as e:
-                                    self.logger.warning("Failed to instantiate tool class %s: %s", attr_name, e)
-                                    continue
-
-                            # If instance exposes as_tools(), prefer that
-                            if hasattr(instance, 'as_tools') and callable(getattr(instance, 'as_tools')):
-                                try:
-                                    tools_export = instance.as_tools()
-                                    self._function_tools_cache[subtype] = tools_export
-                                    self.logger.info("Loaded tool '%s' via %s.as_tools() -> %d callables", subtype, attr_name, len(tools_export) if hasattr(tools_export, '__len__') else 1)
-                                    return tools_export
-                                except Exception as e:
-                                    self.logger.warning("as_tools() call failed on %s: %s", attr_name, e)
-
-                            # Otherwise return the instance itself
-                            self._function_tools_cache[subtype] = instance
-                            self.logger.info("Instantiated tool class %s for subtype '%s'", attr_name, subtype)
-                            return instance
+                                instance = attr(**config) if isinstance(config, dict) else attr()
+                                self.logger.debug("Instantiated %s(**config) for tool subtype %s", attr_name, subtype)
+                            except Exception as e:
+                                self.logger.warning("Failed to instantiate tool class %s: %s", attr_name, e)
+                                continue
+
+                        # If instance exposes as_tools(), prefer that
+                        if hasattr(instance, 'as_tools') and callable(getattr(instance, 'as_tools')):
+                            try:
+                                tools_export = instance.as_tools()
+                                self.logger.info("Loaded tool '%s' via %s.as_tools() -> %d callables", subtype, attr_name, len(tools_export) if hasattr(tools_export, '__len__') else 1)
+                                return tools_export
+                            except Exception as e:
+                                self.logger.warning("as_tools() call failed on %s: %s", attr_name, e)
+
+                        # Otherwise return the instance itself
+                        self.logger.info("Instantiated tool class %s for subtype '%s'", attr_name, subtype)
+                        return instance
             except Exception as e:
                 self.logger.warning("Error while resolving tool module %s: %s", subtype, e)
 
-        # If we found a function, cache and return it
+        # If we found a function, return it
         if tool_function:
-            self._function_tools_cache[subtype] = tool_function
             self.logger.info("Loaded function tool for subtype '%s'", subtype)
             return tool_function
 
         # Return None (not found)
-        self.logger.warning("Tool '%s' not implemented. Add to tools/%s.py", subtype, subtype.replace('-', '_'))
+        self.logger.warning("Tool '%s' not implemented. Add to tools/%s.py", subtype, func_name)
+        return None
+
+    def _load_tool_module(self, subtype: str, module_name: str) -> Optional[ModuleType]:
+        """
+        Load a tool module from the tools directory, either ``<name>.py`` or a
+        ``<name>/__init__.py`` package. Modules are imported through importlib
+        specs, so ``sys.path`` is never touched, and registered in ``sys.modules``
+        under ``_TOOL_PACKAGE_PREFIX``: every factory in the process shares them
+        (tool instances stay per factory), and a tool importing a sibling module
+        gets the same module object the factory loads.
+        """
+        qualified_name = f"{_TOOL_PACKAGE_PREFIX}.{module_name}"
+        module = sys.modules.get(qualified_name)
+        if module is not None:
+            return module
+
+        tool_file = self.tools_dir / f"{module_name}.py"
+        package_init = self.tools_dir / module_name / "__init__.py"
+        if tool_file.exists():
+            # Loaded inside the tools package so relative imports of shared
+            # helpers (``from ._http_common import ...``) resolve.
+            _ensure_tool_package(self.tools_dir)
+            spec = importlib.util.spec_from_file_location(qualified_name, tool_file)
+        elif package_init.exists():
+            # Namespaced so a tool package can never shadow a real top-level
+            # package of the same name (e.g. tools/jira vs. the jira SDK).
+            spec = importlib.util.spec_from_file_location(
+                qualified_name,
+                package_init,
+                submodule_search_locations=[str(package_init.parent)],
+            )
+        else:
+            return None
+
+        if spec is None or spec.loader is None:
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        # Registered before execution, as the import system does, so relative
+        # and sibling imports during loading resolve to this module object.
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception as e:
+            sys.modules.pop(spec.name, None)
+            self.logger.warning("Failed to load tool %s: %s", subtype, e)
+            return None
+
+        self.logger.debug("Loaded tool module for %s from %s", subtype, spec.origin)
+        return module
+
+
+def _ensure_tool_package(tools_dir: Path) -> None:
+    """Register the tools directory as the ``_TOOL_PACKAGE_PREFIX`` package."""
+    if _TOOL_PACKAGE_PREFIX not in sys.modules:
+        package = ModuleType(_TOOL_PACKAGE_PREFIX)
+        package.__path__ = [str(tools_dir)]
+        sys.modules[_TOOL_PACKAGE_PREFIX] = package
+
+
+def _config_cache_key(config: Any) -> Optional[str]:
+    """Canonical, hashable form of a toolConfig dict for cache keys.
+
+    Returns None when the config can't be serialized canonically (e.g.
+    mixed-type keys that can't be sorted); such tools are not cached.
+    """
+    try:
+        return json.dumps(config or {}, sort_keys=True, default=str)
+    except (TypeError, ValueError):
         return None
@@ -7,6 +7,21 @@ from typing import List, Dict, Any, Optional
 from agent_framework.openai import OpenAIChatClient
 from agent_framework.azure import AzureAIAgentClient
 
+try:
+    from agent_framework import ConcurrentBuilder, MagenticBuilder, SequentialBuilder
+except ImportError:
+    # Fallback if orchestration builders aren't available
+    ConcurrentBuilder = None
+    MagenticBuilder = None
+    SequentialBuilder = None
+
+# Orchestration strategy -> MAF workflow builder
+_STRATEGY_BUILDERS = {
+    "sequential": SequentialBuilder,
+    "concurrent": ConcurrentBuilder,
+    "magentic": MagenticBuilder,
+}
+
 
 class AgentFactory:
     """Factory for creating MAF agents from node specifications."""
@@ -18,34 +33,54 @@ class AgentFactory:
         # Provider detection
         self.use_azure = os.getenv("USE_AZURE", "false").lower() == "true"
         self.use_openai_fallback = os.getenv("USE_OPENAI_FALLBACK", "false").lower() == "true"
+        self._default_provider = "azure" if self.use_azure else "openai"
+        
+        # Credentials are read once; the environment is loaded before the factory is built
+        self._openai_api_key = os.getenv("OPENAI_API_KEY")
+        self._azure_endpoint = os.getenv("AZURE_PROJECT_ENDPOINT")
         
-        # Initialize clients
-        self._openai_client = None
+        # Initialize clients (OpenAI clients are bound to a model, so keep one per model)
+        self._openai_clients: Dict[str, OpenAIChatClient] = {}
         self._azure_client = None
+        
+        # Provider -> client getter (called with the model ID)
+        self._providers = {
+            "openai": self._get_openai_client,
+            "azure": lambda model_id: self._get_azure_client(),
+        }
     
     def _get_openai_client(self, model_id: str):
-        """Get or create OpenAI client."""
-        if not self._openai_client:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
+        """Get or create the OpenAI client for a model."""
+        client = self._openai_clients.get(model_id)
+        if client is None:
+            if not self._openai_api_key:
                 raise ValueError("OPENAI_API_KEY not set in environment")
             
-            self._openai_client = OpenAIChatClient(
-                api_key=api_key,
+            client = OpenAIChatClient(
+                api_key=self._openai_api_key,
                 model_id=model_id
             )
-        return self._openai_client
+            self._openai_clients[model_id] = client
+        return client
     
     def _get_azure_client(self):
         """Get or create Azure AI client."""
         if not self._azure_client:
-            project_endpoint = os.getenv("AZURE_PROJECT_ENDPOINT")
-            if not project_endpoint:
+            if not self._azure_endpoint:
                 raise ValueError("AZURE_PROJECT_ENDPOINT not set for Azure provider")
             
-            self._azure_client = AzureAIAgentClient(endpoint=project_endpoint)
+            self._azure_client = AzureAIAgentClient(endpoint=self._azure_endpoint)
         return self._azure_client
     
+    def _get_client(self, provider: str, model_id: str):
+        """Resolve the chat client for a provider, falling back to OpenAI if enabled."""
+        get_client = self._providers.get(provider)
+        if get_client is None:
+            if not self.use_openai_fallback:
+                raise ValueError(f"Unsupported provider: {provider}")
+            get_client = self._providers["openai"]
+        return get_client(model_id)
+    
     def create_agent(
         self,
         node: Dict[str, Any],
@@ -69,17 +104,12 @@ class AgentFactory:
         name = data.get("label", f"agent_{node.get('id')}")
         instructions = data.get("system", "You are a helpful assistant.")
         model = data.get("model", self.default_model)
-        provider = data.get("provider", "openai" if not self.use_azure else "azure")
+        provider = data.get("provider", self._default_provider)
         temperature = data.get("temperature")
         description = data.get("description")
         
         # Determine which client to use
-        if provider == "azure":
-            client = self._get_azure_client()
-        elif provider == "openai" or self.use_openai_fallback:
-            client = self._get_openai_client(model)
-        else:
-            raise ValueError(f"Unsupported provider: {provider}")
+        client = self._get_client(provider, model)
         
         # Build create_agent parameters
         agent_params = {
@@ -144,58 +174,28 @@ class AgentFactory:
         name = data.get("label", f"manager_{manager_node.get('id')}")
         instructions = data.get("system", "You are a team manager coordinating multiple agents.")
         model = data.get("model", self.default_model)
-        provider = data.get("provider", "openai" if not self.use_azure else "azure")
+        provider = data.get("provider", self._default_provider)
         
         # Get client
-        if provider == "azure":
-            client = self._get_azure_client()
-        elif provider == "openai" or self.use_openai_fallback:
-            client = self._get_openai_client(model)
-        else:
-            raise ValueError(f"Unsupported provider: {provider}")
+        client = self._get_client(provider, model)
         
         # Create orchestrated agent based on strategy
-        if strategy == "sequential":
-            from agent_framework import SequentialBuilder
-            
-            builder = SequentialBuilder()
-            for agent in child_agents:
-                builder.add_agent(agent)
-            
-            orchestrated = builder.build(
-                name=name,
-                instructions=instructions,
-                model_id=model
-            )
+        if strategy not in _STRATEGY_BUILDERS:
+            raise ValueError(f"Unsupported orchestration strategy: {strategy}")
         
-        elif strategy == "concurrent":
-            from agent_framework import ConcurrentBuilder
-            
-            builder = ConcurrentBuilder()
-            for agent in child_agents:
-                builder.add_agent(agent)
-            
-            orchestrated = builder.build(
-                name=name,
-                instructions=instructions,
-                model_id=model
-            )
+        builder_cls = _STRATEGY_BUILDERS[strategy]
+        if builder_cls is None:
+            raise RuntimeError(f"{strategy} orchestration not available. Check agent_framework installation.")
         
-        elif strategy == "magentic":
-            from agent_framework import MagenticBuilder
-            
-            builder = MagenticBuilder()
-            for agent in child_agents:
-                builder.add_agent(agent)
-            
-            orchestrated = builder.build(
-                name=name,
-                instructions=instructions,
-                model_id=model
-            )
+        builder = builder_cls()
+        for agent in child_agents:
+            builder.add_agent(agent)
         
-        else:
-            raise ValueError(f"Unsupported orchestration strategy: {strategy}")
+        orchestrated = builder.build(
+            name=name,
+            instructions=instructions,
+            model_id=model
+        )
         
         return orchestrated
 
@@ -209,18 +209,20 @@ class AgentFactory:
         Compose a top-level director that orchestrates multiple manager agents.
         Falls back to sequential strategy if none is specified.
         """
-        node_copy = dict(director_node)
-        node_data = dict(node_copy.get("data", {}))
-        node_copy["data"] = node_data
-
-        node_data.setdefault(
-            "system",
-            "You are the team director responsible for orchestrating manager agents.",
-        )
-        node_data.setdefault("strategy", node_data.get("strategy", "sequential"))
+        data = director_node.get("data") or {}
+        if "system" not in data or "strategy" not in data:
+            # Only the fields create_orchestrated_agent reads; the caller's node is not mutated
+            director_node = {
+                "id": director_node.get("id"),
+                "data": {
+                    "system": "You are the team director responsible for orchestrating manager agents.",
+                    "strategy": "sequential",
+                    **data,
+                },
+            }
 
         return self.create_orchestrated_agent(
-            node_copy,
+            director_node,
             manager_agents,
             **kwargs,
         )
@@ -1,26 +1,44 @@
 """
 GraphBuilder - Parses project.json edges to build agent-tool mappings and orchestration trees.
 """
-from typing import Dict, List, Set, Any
+import sys
+from typing import Dict, Iterator, List, Set, Any
+
+# data.kind values that mark an agent node as an orchestrator
+_MANAGER_KINDS = frozenset({"teamManager", "teamDirector"})
+
+
+def _intern(value: Any) -> Any:
+    """Intern string IDs so repeated dict/set lookups hit the identity fast path."""
+    return sys.intern(value) if type(value) is str else value
 
 
 class GraphBuilder:
     """Builds agent-tool mappings and orchestration hierarchies from graph edges."""
     
     def __init__(self, nodes: List[Dict], edges: List[Dict]):
-        self.nodes = {node["id"]: node for node in nodes}
+        self.nodes = {_intern(node["id"]): node for node in nodes}
         self.edges = edges
+        self._manager_ids: Set[str] = {
+            node_id for node_id, node in self.nodes.items()
+            if node.get("type") == "agent" and (node.get("data") or {}).get("kind") in _MANAGER_KINDS
+        }
+        
+        # Nodes and edges are fixed at construction, so index them in a single pass.
+        self._agent_tools: Dict[str, List[str]] = {}
+        self._manager_children: Dict[str, List[str]] = {}
+        self._child_agents: Set[str] = set()
+        self._connected_tools: Set[str] = set()
+        self._index_edges()
     
-    def build_agent_tool_map(self) -> Dict[str, List[str]]:
-        """
-        Build mapping of agent IDs to their tool node IDs.
-        
-        Looks for edges: tool -> agent
-        
-        Returns:
-            {agent_id: [tool_id1, tool_id2, ...]}
-        """
-        agent_tools = {}
+    def _index_edges(self) -> None:
+        """Populate tool, orchestration and child-agent indexes from one scan of the edges."""
+        nodes = self.nodes
+        agent_tools = self._agent_tools
+        manager_children = self._manager_children
+        child_agents = self._child_agents
+        connected_tools = self._connected_tools
+        manager_ids = self._manager_ids
         
         for edge in self.edges:
             source_id = edge.get("source")
@@ -28,20 +46,36 @@ class GraphBuilder:
             
             if not source_id or not target_id:
                 continue
+            source_id = _intern(source_id)
+            target_id = _intern(target_id)
             
-            source_node = self.nodes.get(source_id)
-            target_node = self.nodes.get(target_id)
-            
-            if not source_node or not target_node:
+            target_node = nodes.get(target_id)
+            if not target_node or target_node.get("type") != "agent":
                 continue
+            source_node = nodes.get(source_id)
+            
+            if target_id in manager_ids:
+                # Anything wired into an orchestrator is not a root agent
+                child_agents.add(source_id)
+                # Agent -> Manager/Director connection
+                if source_node and source_node.get("type") == "agent":
+                    manager_children.setdefault(target_id, []).append(source_id)
             
             # Tool -> Agent connection
-            if source_node.get("type") == "tool" and target_node.get("type") == "agent":
-                if target_id not in agent_tools:
-                    agent_tools[target_id] = []
-                agent_tools[target_id].append(source_id)
+            if source_node and source_node.get("type") == "tool":
+                agent_tools.setdefault(target_id, []).append(source_id)
+                connected_tools.add(source_id)
+    
+    def build_agent_tool_map(self) -> Dict[str, List[str]]:
+        """
+        Build mapping of agent IDs to their tool node IDs.
         
-        return agent_tools
+        Looks for edges: tool -> agent
+        
+        Returns:
+            {agent_id: [tool_id1, tool_id2, ...]}
+        """
+        return self._agent_tools
     
     def build_orchestration_tree(self) -> Dict[str, List[str]]:
         """
@@ -52,31 +86,17 @@ class GraphBuilder:
         Returns:
             {orchestrator_id: [child_agent_or_manager_id, ...]}
         """
-        manager_children = {}
-        
-        for edge in self.edges:
-            source_id = edge.get("source")
-            target_id = edge.get("target")
-            
-            if not source_id or not target_id:
-                continue
-            
-            source_node = self.nodes.get(source_id)
-            target_node = self.nodes.get(target_id)
-            
-            if not source_node or not target_node:
-                continue
-            
-            # Agent -> Manager/Director connection
-            if (source_node.get("type") == "agent" and 
-                target_node.get("type") == "agent" and
-                target_node.get("data", {}).get("kind") in {"teamManager", "teamDirector"}):
-                
-                if target_id not in manager_children:
-                    manager_children[target_id] = []
-                manager_children[target_id].append(source_id)
-        
-        return manager_children
+        return self._manager_children
+    
+    def iter_root_agents(self) -> Iterator[str]:
+        """
+        Yield agent IDs that are not children of any manager.
+        These are the top-level agents/managers to expose in the API.
+        """
+        child_agents = self._child_agents
+        for node_id, node in self.nodes.items():
+            if node.get("type") == "agent" and node_id not in child_agents:
+                yield node_id
     
     def get_root_agents(self) -> List[str]:
         """
@@ -86,28 +106,11 @@ class GraphBuilder:
         Returns:
             List of agent IDs that have no outgoing edges to managers
         """
-        # Find all agents that are children of managers
-        child_agents = set()
-        for edge in self.edges:
-            source_id = edge.get("source")
-            target_id = edge.get("target")
-            
-            if not source_id or not target_id:
-                continue
-            
-            target_node = self.nodes.get(target_id)
-            if (target_node and 
-                target_node.get("type") == "agent" and
-                target_node.get("data", {}).get("kind") in {"teamManager", "teamDirector"}):
-                child_agents.add(source_id)
-        
-        # Return all agents not in child_agents
-        root_agents = []
-        for node_id, node in self.nodes.items():
-            if node.get("type") == "agent" and node_id not in child_agents:
-                root_agents.append(node_id)
-        
-        return root_agents
+        return list(self.iter_root_agents())
+    
+    def iter_tool_dependencies(self, agent_id: str) -> Iterator[str]:
+        """Yield tool node IDs that an agent depends on."""
+        yield from self._agent_tools.get(agent_id, ())
     
     def get_tool_dependencies(self, agent_id: str) -> List[str]:
         """
@@ -119,8 +122,11 @@ class GraphBuilder:
         Returns:
             List of tool node IDs
         """
-        tool_map = self.build_agent_tool_map()
-        return tool_map.get(agent_id, [])
+        return list(self.iter_tool_dependencies(agent_id))
+    
+    def iter_manager_team(self, manager_id: str) -> Iterator[str]:
+        """Yield child agent IDs for a team manager."""
+        yield from self._manager_children.get(manager_id, ())
     
     def get_manager_team(self, manager_id: str) -> List[str]:
         """
@@ -132,16 +138,11 @@ class GraphBuilder:
         Returns:
             List of child agent node IDs
         """
-        orchestration_tree = self.build_orchestration_tree()
-        return orchestration_tree.get(manager_id, [])
+        return list(self.iter_manager_team(manager_id))
     
     def is_manager(self, node_id: str) -> bool:
         """Check if a node is an orchestrator (team manager or director)."""
-        node = self.nodes.get(node_id)
-        if not node:
-            return False
-        return (node.get("type") == "agent" and 
-                node.get("data", {}).get("kind") in {"teamManager", "teamDirector"})
+        return node_id in self._manager_ids
     
     def get_orchestration_strategy(self, manager_id: str) -> str:
         """
@@ -167,22 +168,22 @@ class GraphBuilder:
             List of validation messages
         """
         warnings = []
+        coordinator_warnings = []
+        connected_tools = self._connected_tools
+        manager_ids = self._manager_ids
+        manager_children = self._manager_children
         
-        # Check for orphaned tools (tools not connected to any agent)
-        agent_tools = self.build_agent_tool_map()
-        connected_tools = set()
-        for tools in agent_tools.values():
-            connected_tools.update(tools)
-        
-        for node_id, node in self.nodes.items():
-            if node.get("type") == "tool" and node_id not in connected_tools:
-                warnings.append(f"Tool '{node.get('data', {}).get('label', node_id)}' is not connected to any agent")
-        
-        # Check for managers with no children
-        orchestration_tree = self.build_orchestration_tree()
         for node_id, node in self.nodes.items():
-            if self.is_manager(node_id) and node_id not in orchestration_tree:
-                warnings.append(f"Coordinator '{node.get('data', {}).get('label', node_id)}' has no child agents")
+            # Check for orphaned tools (tools not connected to any agent)
+            if node.get("type") == "tool":
+                if node_id not in connected_tools:
+                    warnings.append(f"Tool '{node.get('data', {}).get('label', node_id)}' is not connected to any agent")
+            # Check for managers with no children
+            elif node_id in manager_ids and node_id not in manager_children:
+                coordinator_warnings.append(f"Coordinator '{node.get('data', {}).get('label', node_id)}' has no child agents")
+        
+        # Tool warnings are reported before coordinator warnings
+        warnings.extend(coordinator_warnings)
         
         # Check for circular dependencies (basic check)
         # A more thorough check would use DFS/cycle detection
@@ -8,6 +8,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, AsyncIterator, List
 import json
+import logging
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -18,6 +19,8 @@ from agent_factory import AgentFactory
 from graph_builder import GraphBuilder
 
 load_dotenv()
+# Configure logging once for the app (tool loading reports at INFO level)
+logging.basicConfig(level=logging.INFO)
 
 app = FastAPI(title="MAF Agent Backend", version="1.0.0")
 
@@ -77,7 +80,6 @@ async def build_agents():
         print(f"⚠ {warning}")
     
     # Build mappings
-    agent_tool_map = graph_builder.build_agent_tool_map()
     orchestration_tree = graph_builder.build_orchestration_tree()
     
     # Index nodes
@@ -106,8 +108,11 @@ async def build_agents():
             node_id not in orchestration_tree):
             
             # Get tools for this agent
-            tool_ids = agent_tool_map.get(node_id, [])
-            agent_tools = [tool_instances[tid] for tid in tool_ids if tid in tool_instances]
+            agent_tools = [
+                tool_instances[tid]
+                for tid in graph_builder.iter_tool_dependencies(node_id)
+                if tid in tool_instances
+            ]
             
             try:
                 agent = agent_factory.create_agent(node, tools=agent_tools)
@@ -121,10 +126,9 @@ async def build_agents():
     # Step 3: Create child agents for managers
     child_agents_map = {}
     for manager_id in orchestration_tree.keys():
-        child_ids = orchestration_tree[manager_id]
         child_agents_map[manager_id] = []
         
-        for child_id in child_ids:
+        for child_id in graph_builder.iter_manager_team(manager_id):
             if child_id in standalone_agents:
                 # Already created as standalone
                 child_agents_map[manager_id].append(standalone_agents[child_id])
@@ -136,8 +140,11 @@ async def build_agents():
                 continue
             
             # Get tools for child agent
-            tool_ids = agent_tool_map.get(child_id, [])
-            agent_tools = [tool_instances[tid] for tid in tool_ids if tid in tool_instances]
+            agent_tools = [
+                tool_instances[tid]
+                for tid in graph_builder.iter_tool_dependencies(child_id)
+                if tid in tool_instances
+            ]
             
             try:
                 agent = agent_factory.create_agent(child_node, tools=agent_tools)
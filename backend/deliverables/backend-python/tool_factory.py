@@ -3,8 +3,11 @@ ToolFactory - Creates MAF tool instances from node specifications.
 Supports MCP, Hosted, and Function tools following MAF patterns.
 """
 import os
+import sys
+import importlib.util
 from typing import Dict, Any, Optional, Callable
 from pathlib import Path
+from types import ModuleType
 import logging
 
 # MAF tool imports
@@ -22,6 +25,10 @@ except ImportError:
     HostedFileSearchTool = None
     HostedWebSearchTool = None
 
+# sys.modules namespace for file-loaded tools, so tools/jira.py can never
+# shadow (or be shadowed by) a real top-level package of the same name.
+_TOOL_MODULE_PREFIX = "agent_studio_tools"
+
 
 class ToolFactory:
     """Factory for creating MAF tools from node specifications."""
@@ -29,11 +36,19 @@ class ToolFactory:
     def __init__(self):
         self.tools_dir = Path(__file__).parent.parent / "tools"
         self._function_tools_cache = {}
-        # Module logger
+        # Default Bing grounding connection, used when toolConfig doesn't name one
+        self._bing_connection_name = os.getenv("BING_CONNECTION_NAME")
+        self._bing_connection_id = os.getenv("BING_CONNECTION_ID")
+        # MCP and hosted tool builders by subtype; anything else is a function tool
+        self._builders: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "mcp-tool": self._build_mcp_tool,
+            "code-interpreter": lambda config: self._build_code_interpreter(),
+            "file-search": self._build_file_search,
+            "google-search": self._build_web_search,
+            "bing-search": self._build_web_search,
+        }
+        # Module logger; logging itself is configured by the application
         self.logger = logging.getLogger(__name__)
-        # If the application hasn't configured logging, set a sensible default
-        if not logging.getLogger().handlers:
-            logging.basicConfig(level=logging.INFO)
     
     def create_tool(self, node: Dict[str, Any]) -> Any:
         """
@@ -52,17 +67,10 @@ class ToolFactory:
         if not subtype:
             raise ValueError(f"Tool node {node.get('id')} missing subtype")
         
-        # MCP Tools
-        if subtype == "mcp-tool":
-            return self._build_mcp_tool(tool_config)
-        
-        # Hosted Tools
-        if subtype == "code-interpreter":
-            return self._build_code_interpreter()
-        if subtype == "file-search":
-            return self._build_file_search(tool_config)
-        if subtype in ["google-search", "bing-search"]:
-            return self._build_web_search(tool_config)
+        # MCP and Hosted Tools
+        builder = self._builders.get(subtype)
+        if builder is not None:
+            return builder(tool_config)
         
         # Function Tools (yahoo-finance, pandas, etc.)
         return self._build_function_tool(subtype, tool_config)
@@ -103,8 +111,8 @@ class ToolFactory:
             raise RuntimeError("Web search not available. Check agent_framework installation.")
         
         # Connection name or ID from config or env
-        connection_name = config.get("connectionName") or os.getenv("BING_CONNECTION_NAME")
-        connection_id = config.get("connectionId") or os.getenv("BING_CONNECTION_ID")
+        connection_name = config.get("connectionName") or self._bing_connection_name
+        connection_id = config.get("connectionId") or self._bing_connection_id
         
         if connection_name:
             return HostedWebSearchTool(connection_name=connection_name)
@@ -121,36 +129,51 @@ class ToolFactory:
         Looks for:
         - tools/{subtype}.py with a function matching the tool name
         - tools/{subtype}/__init__.py with exported functions
+        
+        A module can name its export explicitly with ``__tool__ = MyTool``
+        (a class, a callable or a list of callables); this skips the
+        attribute scan used for legacy modules.
         """
         if subtype in self._function_tools_cache:
             return self._function_tools_cache[subtype]
         
         # Try to import from tools directory
-        tool_file = self.tools_dir / f"{subtype.replace('-', '_')}.py"
-        tool_module_dir = self.tools_dir / subtype.replace('-', '_')
+        module_name = subtype.replace('-', '_')
+        tool_file = self.tools_dir / f"{module_name}.py"
+        tool_module_dir = self.tools_dir / module_name
         
         tool_function = None
-        module = None
+        # Reuse a module loaded earlier (e.g. by another factory instance)
+        module = sys.modules.get(f"{_TOOL_MODULE_PREFIX}.{module_name}")
 
         # Try file import
-        if tool_file.exists():
+        if module is None and tool_file.exists():
             try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(subtype, tool_file)
+                qualified_name = f"{_TOOL_MODULE_PREFIX}.{module_name}"
+                # Register the parent package so relative imports of shared
+                # helpers (``from ._http_common import ...``) resolve.
+                if _TOOL_MODULE_PREFIX not in sys.modules:
+                    package = ModuleType(_TOOL_MODULE_PREFIX)
+                    package.__path__ = [str(self.tools_dir)]
+                    sys.modules[_TOOL_MODULE_PREFIX] = package
+                spec = importlib.util.spec_from_file_location(qualified_name, tool_file)
                 if spec and spec.loader:
                     module = importlib.util.module_from_spec(spec)
                     spec.loader.exec_module(module)
+                    sys.modules[qualified_name] = module
                     self.logger.debug("Loaded tool module from file: %s", tool_file)
             except Exception as e:
+                module = None
                 self.logger.warning("Failed to load tool %s from file: %s", subtype, e)
 
         # Try module import
         if module is None and tool_module_dir.exists() and (tool_module_dir / "__init__.py").exists():
             try:
-                import sys
                 sys.path.insert(0, str(self.tools_dir))
-                module = __import__(subtype.replace('-', '_'))
-                sys.path.pop(0)
+                try:
+                    module = __import__(module_name)
+                finally:
+                    sys.path.remove(str(self.tools_dir))
                 self.logger.debug("Imported tool module: %s", subtype)
             except Exception as e:
                 self.logger.warning("Failed to load tool %s from module: %s", subtype, e)
@@ -158,9 +181,20 @@ class ToolFactory:
         # If we loaded a module, try to resolve common patterns
         if module is not None:
             try:
+                # 0) Explicit registration: __tool__ = MyTool (class, callable or list)
+                registered = getattr(module, "__tool__", None)
                 # 1) Look for a function matching the subtype name
-                func_name = subtype.replace('-', '_')
-                if hasattr(module, func_name):
+                func_name = module_name
+                if registered is not None:
+                    if isinstance(registered, type):
+                        tools_export = self._instantiate_tool_class(registered, subtype, config)
+                        if tools_export is not None:
+                            self._function_tools_cache[subtype] = tools_export
+                            return tools_export
+                    else:
+                        tool_function = registered
+                        self.logger.info("Found registered __tool__ in module %s", subtype)
+                elif hasattr(module, func_name):
                     tool_function = getattr(module, func_name)
                     self.logger.info("Found function tool '%s' in module %s", func_name, subtype)
                 # 2) Look for a top-level 'main' function
@@ -168,40 +202,17 @@ class ToolFactory:
                     tool_function = module.main
                     self.logger.info("Found 'main' function tool in module %s", subtype)
                 else:
-                    # 3) Look for classes ending with 'Tool' and instantiate them
+                    # 3) Legacy modules: look for classes ending with 'Tool' and instantiate them
                     for attr_name in dir(module):
                         try:
                             attr = getattr(module, attr_name)
                         except Exception:
                             continue
                         if isinstance(attr, type) and attr_name.lower().endswith('tool'):
-                            try:
-                                # Try instantiation with no args
-                                instance = attr()
-                                self.logger.debug("Instantiated %s() for tool subtype %s", attr_name, subtype)
-                            except TypeError:
-                                # Try passing config as kwargs if available
-                                try:
-                                    instance = attr(**config) if isinstance(config, dict) else attr()
-                                    self.logger.debug("Instantiated %s(**config) for tool subtype %s", attr_name, subtype)
-                                except Exception as e:
-                                    self.logger.warning("Failed to instantiate tool class %s: %s", attr_name, e)
-                                    continue
-
-                            # If instance exposes as_tools(), prefer that
-                            if hasattr(instance, 'as_tools') and callable(getattr(instance, 'as_tools')):
-                                try:
-                                    tools_export = instance.as_tools()
-                                    self._function_tools_cache[subtype] = tools_export
-                                    self.logger.info("Loaded tool '%s' via %s.as_tools() -> %d callables", subtype, attr_name, len(tools_export) if hasattr(tools_export, '__len__') else 1)
-                                    return tools_export
-                                except Exception as e:
-                                    self.logger.warning("as_tools() call failed on %s: %s", attr_name, e)
-
-                            # Otherwise return the instance itself
-                            self._function_tools_cache[subtype] = instance
-                            self.logger.info("Instantiated tool class %s for subtype '%s'", attr_name, subtype)
-                            return instance
+                            tools_export = self._instantiate_tool_class(attr, subtype, config)
+                            if tools_export is not None:
+                                self._function_tools_cache[subtype] = tools_export
+                                return tools_export
             except Exception as e:
                 self.logger.warning("Error while resolving tool module %s: %s", subtype, e)
 
@@ -212,5 +223,39 @@ class ToolFactory:
             return tool_function
 
         # Return a placeholder that logs a warning
-        self.logger.warning("Tool '%s' not implemented. Add to tools/%s.py", subtype, subtype.replace('-', '_'))
+        self.logger.warning("Tool '%s' not implemented. Add to tools/%s.py", subtype, module_name)
         return None
+    
+    def _instantiate_tool_class(self, tool_class: type, subtype: str, config: Dict[str, Any]) -> Any:
+        """
+        Instantiate a tool class and return its export.
+        
+        Prefers ``instance.as_tools()`` when available, otherwise the instance
+        itself. Returns None if the class can't be instantiated.
+        """
+        class_name = tool_class.__name__
+        try:
+            # Try instantiation with no args
+            instance = tool_class()
+            self.logger.debug("Instantiated %s() for tool subtype %s", class_name, subtype)
+        except TypeError:
+            # Try passing config as kwargs if available
+            try:
+                instance = tool_class(**config) if isinstance(config, dict) else tool_class()
+                self.logger.debug("Instantiated %s(**config) for tool subtype %s", class_name, subtype)
+            except Exception as e:
+                self.logger.warning("Failed to instantiate tool class %s: %s", class_name, e)
+                return None
+
+        # If instance exposes as_tools(), prefer that
+        if hasattr(instance, 'as_tools') and callable(getattr(instance, 'as_tools')):
+            try:
+                tools_export = instance.as_tools()
+                self.logger.info("Loaded tool '%s' via %s.as_tools() -> %d callables", subtype, class_name, len(tools_export) if hasattr(tools_export, '__len__') else 1)
+                return tools_export
+            except Exception as e:
+                self.logger.warning("as_tools() call failed on %s: %s", class_name, e)
+
+        # Otherwise return the instance itself
+        self.logger.info("Instantiated tool class %s for subtype '%s'", class_name, subtype)
+        return instance
@@ -0,0 +1,80 @@
+"""Shared HTTP helpers for the REST-backed tools (ClickUp, Discord, Confluence).
+
+Not a tool itself: the tool catalog skips modules whose name starts with ``_``.
+"""
+from __future__ import annotations
+
+import json
+import time
+from functools import wraps
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Upper bound on cached read results kept per tool instance.
+READ_CACHE_MAX_ENTRIES = 512
+
+
+def json_dumps(payload: Any) -> bytes:
+    return orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+
+
+def json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def cached_read(ttl: float):
+    """Cache successful results of a read-only tool method for ``ttl`` seconds.
+
+    Entries live on the instance's ``_read_cache`` OrderedDict, keyed by method
+    and arguments. Expired entries are kept until evicted: when a refresh fails,
+    the last good result is returned flagged ``"stale": True`` instead of the error.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = self._read_cache.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+            result = fn(self, *args, **kwargs)
+            if result.get("ok"):
+                self._read_cache[key] = (now, result)
+                if len(self._read_cache) > READ_CACHE_MAX_ENTRIES:
+                    try:
+                        self._read_cache.popitem(last=False)
+                    except KeyError:
+                        pass
+            elif entry is not None:
+                return {**entry[1], "stale": True}
+            return result
+        return wrapper
+    return decorator
+
+
+def build_session(headers: Dict[str, str], pool_size: int) -> requests.Session:
+    """Keep-alive session with a connection pool of ``pool_size`` connections.
+
+    Transient 5xx failures are retried with backoff for idempotent methods
+    only. 429s are left to the calling tool, which waits out the advertised
+    rate-limit window instead of backing off blindly.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_size, max_retries=retry))
+    return session
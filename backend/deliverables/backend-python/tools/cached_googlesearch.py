@@ -1,5 +1,6 @@
 import time
-from typing import Optional, Tuple, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Tuple
 import threading
 from .google_web_search import GoogleSearchTool
 
@@ -7,36 +8,47 @@ from .google_web_search import GoogleSearchTool
 class CachedGoogleSearchTools:
     """Wrapper around GoogleSearchTool.GoogleSearchTools with an in-memory TTL cache.
 
-    Cache key is (query, max_results, language). TTL default 300 seconds.
-    Thread-safe.
+    Cache key is (query, max_results, language). TTL default 300 seconds; at most
+    ``max_entries`` results are kept, least recently used first out.
+    Thread-safe: cache hits are served without taking the lock, writes are locked.
     """
 
-    def __init__(self, fixed_max_results: Optional[int] = None, fixed_language: Optional[str] = None, ttl: int = 300, **kwargs):
+    __slots__ = ("_tools", "_cache_ttl", "_max_entries", "_cache", "_lock")
+
+    def __init__(self, fixed_max_results: Optional[int] = None, fixed_language: Optional[str] = None, ttl: int = 300, max_entries: int = 1024, **kwargs):
+        # This wrapper is the only cache; the inner tool's own cache is switched off.
+        kwargs["cache_ttl"] = 0
         self._tools = GoogleSearchTool(fixed_max_results=fixed_max_results, fixed_language=fixed_language, **kwargs)
         self._cache_ttl = ttl
-        self._cache: Dict[Tuple[str, int, str], Tuple[float, str]] = {}
+        self._max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, int, str], Tuple[float, str]]" = OrderedDict()
         self._lock = threading.Lock()
 
     def google_search(self, query: str, max_results: int = 5, language: str = "en") -> str:
-        key = (query.strip(), int(max_results), str(language))
+        if (type(max_results) is int and type(language) is str
+                and not (query[:1].isspace() or query[-1:].isspace())):
+            # Already normalized; skip the strip/int/str copies
+            key = (query, max_results, language)
+        else:
+            key = (query.strip(), int(max_results), str(language))
         now = time.time()
-        with self._lock:
-            entry = self._cache.get(key)
-            if entry:
-                ts, value = entry
-                if now - ts < self._cache_ttl:
-                    return value
-                else:
-                    # expired
-                    del self._cache[key]
-
-        # not cached or expired; perform search
-        result = self._tools.google_search(query, max_results=max_results, language=language)
-        with self._lock:
+        # Single dict operations are atomic, so hits don't need the lock
+        entry = self._cache.get(key)
+        if entry and now - entry[0] < self._cache_ttl:
             try:
-                self._cache[key] = (now, result)
-            except Exception:
+                self._cache.move_to_end(key)
+            except KeyError:
+                # evicted by a concurrent writer; the value we read is still valid
                 pass
+            return entry[1]
+
+        # not cached or expired; perform search outside the lock so misses run concurrently
+        result = self._tools.google_search(query, max_results=max_results, language=language)
+        with self._lock:
+            self._cache[key] = (now, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
         return result
 
     # Expose attributes if needed
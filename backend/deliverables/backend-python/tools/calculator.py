@@ -18,4 +18,6 @@ class Calculator(CalculatorTools):
     pass
 
 
+__tool__ = Calculator
+
 __all__ = ["Calculator", "CalculatorTools"]
@@ -4,9 +4,27 @@ from typing_extensions import Annotated
 from pydantic import Field
 import math
 
+_SMALL_PRIME_LIMIT = 1000
+
+def _sieve(limit: int) -> frozenset:
+    flags = bytearray([1]) * limit
+    flags[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if flags[i]: flags[i*i::i] = bytes(len(range(i*i, limit, i)))
+    return frozenset(i for i in range(limit) if flags[i])
+
+# Primes below _SMALL_PRIME_LIMIT, so typical inputs are a set lookup
+_SMALL_PRIMES = _sieve(_SMALL_PRIME_LIMIT)
+
+# n! for small n, precomputed at import
+_FACT_TABLE = tuple(math.factorial(i) for i in range(128))
+
 class CalculatorTools:
+    __slots__ = ("enable_all", "_tools_cache")
+
     def __init__(self, enable_all: bool = True, **kwargs):
         self.enable_all = enable_all
+        self._tools_cache: List[object] | None = None
 
     def add(self, a: Annotated[float, Field(description="First number")], b: Annotated[float, Field(description="Second number")]) -> Dict[str, Any]:
         return {"operation":"addition","result": a+b}
@@ -21,19 +39,23 @@ class CalculatorTools:
     def exponentiate(self, a: Annotated[float, Field()], b: Annotated[float, Field()]) -> Dict[str, Any]:
         return {"operation":"exponentiation","result": math.pow(a,b)}
     def factorial(self, n: Annotated[int, Field(ge=0)]) -> Dict[str, Any]:
+        if 0 <= n < len(_FACT_TABLE): return {"operation":"factorial","result": _FACT_TABLE[n]}
         try: return {"operation":"factorial","result": math.factorial(n)}
         except ValueError: return {"operation":"factorial","error":"Factorial of a negative number is undefined"}
     def is_prime(self, n: Annotated[int, Field()]) -> Dict[str, Any]:
-        if n <= 1: return {"operation":"prime_check","result": False}
-        if n <= 3: return {"operation":"prime_check","result": True}
+        if isinstance(n, float):
+            # Integral floats (7.0) are checked as ints; 7.5, nan and inf have no primality
+            if not n.is_integer(): return {"operation":"prime_check","error":"Prime check requires an integer"}
+            n = int(n)
+        if n < _SMALL_PRIME_LIMIT: return {"operation":"prime_check","result": n in _SMALL_PRIMES}
         if n % 2 == 0 or n % 3 == 0: return {"operation":"prime_check","result": False}
-        i = 5
-        while i*i <= n:
+        for i in range(5, math.isqrt(n) + 1, 6):
             if n % i == 0 or n % (i+2) == 0: return {"operation":"prime_check","result": False}
-            i += 6
         return {"operation":"prime_check","result": True}
     def square_root(self, n: Annotated[float, Field()]) -> Dict[str, Any]:
         if n < 0: return {"operation":"square_root","error":"Square root of a negative number is undefined"}
         return {"operation":"square_root","result": math.sqrt(n)}
     def as_tools(self) -> List[object]:
-        return [self.add,self.subtract,self.multiply,self.divide,self.exponentiate,self.factorial,self.is_prime,self.square_root]
+        if self._tools_cache is None:
+            self._tools_cache = [self.add,self.subtract,self.multiply,self.divide,self.exponentiate,self.factorial,self.is_prime,self.square_root]
+        return self._tools_cache
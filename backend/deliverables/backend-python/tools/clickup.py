@@ -2,18 +2,39 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from typing_extensions import Annotated
 from pydantic import Field
 
 import requests
 
+from ._http_common import build_session, cached_read, json_dumps, json_loads
+
 SAMPLE_PROMPTS = [
     "List the ClickUp spaces we have access to so I can choose the right backlog.",
     "Create a new onboarding task in the customer-success list with a short description.",
     "Update task XYZ to status 'in progress' and add a note.",
 ]
 
+# Upper bound on concurrent ClickUp requests issued by the bulk helpers.
+MAX_CONCURRENT_REQUESTS = 8
+# Safety cap on pages walked by list_tasks_bulk/iter_tasks (ClickUp returns 100 tasks per page).
+MAX_BULK_PAGES = 50
+
+# Read-only lookups are cached per instance: short TTL for lists, long TTL for
+# spaces, which rarely change within a conversation. Task writes clear the cache.
+SHORT_CACHE_TTL = 30
+LONG_CACHE_TTL = 300
+
+# 429 responses are retried once the advertised rate-limit window resets, at
+# most this many times; waits longer than MAX_RATE_LIMIT_WAIT are surfaced as errors.
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 60.0
+
 
 class ClickUpTool:
     REQUIRED_SECRETS = ["CLICKUP_API_KEY", "CLICKUP_TEAM_ID"]
@@ -31,23 +52,99 @@ class ClickUpTool:
                 "environment variables (CLICKUP_API_KEY, CLICKUP_TEAM_ID)."
             )
         self._base_url = "https://api.clickup.com/api/v2"
-        self._headers = {"Authorization": self._api_key}
+        self._headers = {"Authorization": self._api_key, "Content-Type": "application/json"}
+        self._session = build_session(self._headers, MAX_CONCURRENT_REQUESTS)
+        self._read_cache: "OrderedDict[Any, Any]" = OrderedDict()
+        # ClickUp rate limits per token, so one bucket: (reset epoch, remaining).
+        self._bucket: Optional[Tuple[float, int]] = None
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
+    def _wait_for_bucket(self) -> None:
+        """Sleep until the token's rate-limit window resets if it is exhausted."""
+        if self._bucket is None:
+            return
+        reset_at, remaining = self._bucket
+        if remaining <= 0:
+            delay = reset_at - time.time()
+            if 0 < delay <= MAX_RATE_LIMIT_WAIT:
+                time.sleep(delay)
+
+    def _update_bucket(self, response: requests.Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            self._bucket = (float(reset), int(remaining))
+        except ValueError:
+            return
+
+    def _retry_after(self, response: requests.Response) -> float:
+        value = response.headers.get("Retry-After")
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            pass
+        if self._bucket is not None:
+            return max(self._bucket[0] - time.time(), 0.0)
+        return 1.0
+
     def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         payload: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if method != "GET":
+            return self._send(method, endpoint, params, payload)
+        # Concurrent identical GETs share the one request already in flight.
+        key = f"{endpoint}:{params}"
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = self._send(method, endpoint, params, payload)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return result
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         url = f"{self._base_url}/{endpoint}"
         try:
-            response = requests.request(method, url, headers=self._headers, params=params, json=payload, timeout=30)
+            body = json_dumps(payload) if payload is not None else None
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                self._wait_for_bucket()
+                response = self._session.request(method, url, params=params, data=body, timeout=30)
+                self._update_bucket(response)
+                if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                    break
+                delay = self._retry_after(response)
+                if delay > MAX_RATE_LIMIT_WAIT:
+                    break
+                time.sleep(delay)
             response.raise_for_status()
-            return {"ok": True, "data": response.json() if response.text else None}
+            return {"ok": True, "data": json_loads(response.content) if response.content else None}
         except requests.exceptions.HTTPError as exc:
             try:
                 detail = response.json()
@@ -57,9 +154,32 @@ class ClickUpTool:
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Request failed: {exc}"}
 
+    @staticmethod
+    def _fan_out(
+        fn: Callable[[str], Dict[str, Any]],
+        items: List[str],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> List[Dict[str, Any]]:
+        """Run independent requests concurrently, preserving input order."""
+        if len(items) <= 1 or max_concurrency <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    @staticmethod
+    def _summarize_task(task: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": task["id"],
+            "name": task.get("name"),
+            "status": task.get("status", {}).get("status"),
+            "assignees": [assignee.get("username") for assignee in task.get("assignees", [])],
+            "url": task.get("url"),
+        }
+
     # ------------------------------------------------------------------ #
     # Tool methods
     # ------------------------------------------------------------------ #
+    @cached_read(LONG_CACHE_TTL)
     def list_spaces(self) -> Dict[str, Any]:
         """Return spaces available to the configured team."""
         result = self._request("GET", f"team/{self._team_id}/space")
@@ -71,6 +191,7 @@ class ClickUpTool:
         ]
         return {"ok": True, "spaces": spaces}
 
+    @cached_read(SHORT_CACHE_TTL)
     def list_lists(
         self,
         space_id: Annotated[str, Field(description="Target ClickUp space identifier.")],
@@ -87,22 +208,81 @@ class ClickUpTool:
     def list_tasks(
         self,
         list_id: Annotated[str, Field(description="ClickUp list identifier to inspect.")],
+        page: Annotated[int, Field(description="Page to fetch (the previous next_cursor).", ge=0)] = 0,
+        include_closed: Annotated[bool, Field(description="Also return closed tasks.")] = False,
     ) -> Dict[str, Any]:
-        result = self._request("GET", f"list/{list_id}/task")
+        page = int(page)
+        params = {
+            "page": page,
+            "include_closed": "true" if include_closed else "false",
+            "subtasks": "false",
+        }
+        result = self._request("GET", f"list/{list_id}/task", params=params)
         if not result["ok"]:
             return result
-        tasks = []
-        for task in result["data"].get("tasks", []):
-            tasks.append(
-                {
-                    "id": task["id"],
-                    "name": task.get("name"),
-                    "status": task.get("status", {}).get("status"),
-                    "assignees": [assignee.get("username") for assignee in task.get("assignees", [])],
-                    "url": task.get("url"),
-                }
+        data = result["data"] or {}
+        tasks = [self._summarize_task(task) for task in data.get("tasks", [])]
+        next_cursor = None if not tasks or data.get("last_page") else page + 1
+        return {"ok": True, "tasks": tasks, "next_cursor": next_cursor}
+
+    def iter_tasks(self, list_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield every task in a list, fetching one page at a time."""
+        page: Optional[int] = 0
+        for _ in range(MAX_BULK_PAGES):
+            result = self.list_tasks(list_id, page=page)
+            if not result["ok"]:
+                raise RuntimeError(result["error"])
+            yield from result["tasks"]
+            page = result["next_cursor"]
+            if page is None:
+                return
+
+    def list_tasks_bulk(
+        self,
+        list_ids: Annotated[List[str], Field(description="ClickUp list identifiers to inspect.")],
+    ) -> Dict[str, Any]:
+        """Return tasks for several lists using the team-level filtered task query."""
+        list_ids = list(dict.fromkeys(list_ids))
+        by_list: Dict[str, List[Dict[str, Any]]] = {list_id: [] for list_id in list_ids}
+        if not list_ids:
+            return {"ok": True, "by_list": by_list}
+        for page in range(MAX_BULK_PAGES):
+            result = self._request(
+                "GET",
+                f"team/{self._team_id}/task",
+                params={"list_ids[]": list_ids, "page": page},
             )
-        return {"ok": True, "tasks": tasks}
+            if not result["ok"]:
+                return result
+            data = result["data"] or {}
+            tasks = data.get("tasks", [])
+            for task in tasks:
+                list_id = (task.get("list") or {}).get("id")
+                if list_id in by_list:
+                    by_list[list_id].append(self._summarize_task(task))
+            if not tasks or data.get("last_page"):
+                break
+        return {"ok": True, "by_list": by_list}
+
+    def get_tasks_bulk(
+        self,
+        task_ids: Annotated[List[str], Field(description="ClickUp task identifiers.")],
+        max_concurrency: Annotated[int, Field(description="Maximum parallel requests.", ge=1, le=MAX_CONCURRENT_REQUESTS)] = MAX_CONCURRENT_REQUESTS,
+    ) -> Dict[str, Any]:
+        """Fetch several tasks concurrently instead of one round trip at a time."""
+        task_ids = list(dict.fromkeys(task_ids))
+        tasks: Dict[str, Any] = {}
+        errors: Dict[str, Any] = {}
+        results = self._fan_out(self.get_task, task_ids, min(int(max_concurrency), MAX_CONCURRENT_REQUESTS))
+        for task_id, result in zip(task_ids, results):
+            if result["ok"]:
+                tasks[task_id] = result["data"]
+            else:
+                errors[task_id] = result["error"]
+        response: Dict[str, Any] = {"ok": bool(tasks) or not errors, "tasks": tasks}
+        if errors:
+            response["errors"] = errors
+        return response
 
     def get_task(
         self,
@@ -122,7 +302,9 @@ class ClickUpTool:
             payload["description"] = description
         if status:
             payload["status"] = status
-        return self._request("POST", f"list/{list_id}/task", payload=payload)
+        result = self._request("POST", f"list/{list_id}/task", payload=payload)
+        self._read_cache.clear()
+        return result
 
     def update_task(
         self,
@@ -140,13 +322,16 @@ class ClickUpTool:
             payload["status"] = status
         if not payload:
             return {"ok": False, "error": "No fields provided to update."}
-        return self._request("PUT", f"task/{task_id}", payload=payload)
+        result = self._request("PUT", f"task/{task_id}", payload=payload)
+        self._read_cache.clear()
+        return result
 
     def delete_task(
         self,
         task_id: Annotated[str, Field(description="Task identifier to delete.")],
     ) -> Dict[str, Any]:
         result = self._request("DELETE", f"task/{task_id}")
+        self._read_cache.clear()
         if not result["ok"]:
             return result
         return {"ok": True, "task": task_id}
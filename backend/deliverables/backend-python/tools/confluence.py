@@ -4,16 +4,31 @@ Provides read/write helpers backed by `atlassian-python-api`.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from typing_extensions import Annotated
 from pydantic import Field
 
+from ._http_common import READ_CACHE_MAX_ENTRIES, cached_read
+
 SAMPLE_PROMPTS = [
     "Fetch the latest release notes page from the Engineering space.",
     "List the first 25 Confluence spaces so I can choose where to document runbooks.",
     "Create a draft incident report page under the 'Operations' parent page.",
 ]
 
+# Read-only lookups are cached per instance: short TTL for page lookups,
+# long TTL for spaces, which rarely change within a conversation.
+# Creating or updating a page clears the cache.
+SHORT_CACHE_TTL = 30
+LONG_CACHE_TTL = 300
+# Worker threads for bulk page reads (the Atlassian client is blocking).
+MAX_CONCURRENT_REQUESTS = 8
+# Largest page batch requested from Confluence per call.
+PAGE_BATCH_SIZE = 100
+
 
 class ConfluenceTool:
     REQUIRED_SECRETS = ["CONFLUENCE_URL", "CONFLUENCE_USERNAME", "CONFLUENCE_API_KEY"]
@@ -52,6 +67,11 @@ class ConfluenceTool:
             verify_ssl=verify_ssl,
         )
         self._base_url = resolved_url.rstrip("/")
+        self._read_cache: "OrderedDict[Any, Any]" = OrderedDict()
+        # Page bodies by id, kept with the version they were fetched at (id -> (version, body)).
+        self._page_bodies: "OrderedDict[str, Tuple[Any, Optional[str]]]" = OrderedDict()
+        # Threads are started on first use and reused across calls.
+        self._pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
 
     # ------------------------------------------------------------------ #
     # Helper utilities
@@ -61,9 +81,25 @@ class ConfluenceTool:
             raise ValueError("Space key/name is required.")
         return space
 
+    def _page_body(self, page_id: str, version: Any, expand: str) -> Optional[str]:
+        """Return the page body, re-fetching it only when ``version`` has moved on."""
+        cached = self._page_bodies.get(page_id)
+        if cached is not None and version is not None and cached[0] == version:
+            return cached[1]
+        page = self._client.get_page_by_id(page_id, expand=expand)
+        body = (page or {}).get("body", {}).get("storage", {}).get("value")
+        self._page_bodies[page_id] = (version, body)
+        if len(self._page_bodies) > READ_CACHE_MAX_ENTRIES:
+            try:
+                self._page_bodies.popitem(last=False)
+            except KeyError:
+                pass
+        return body
+
     # ------------------------------------------------------------------ #
     # Public tool methods
     # ------------------------------------------------------------------ #
+    @cached_read(LONG_CACHE_TTL)
     def list_spaces(
         self,
         limit: Annotated[int, Field(description="Maximum number of spaces to return.", ge=1, le=200)] = 25,
@@ -78,56 +114,112 @@ class ConfluenceTool:
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to list spaces: {exc}"}
 
+    def iter_pages(
+        self,
+        space: str,
+        page_size: int = PAGE_BATCH_SIZE,
+        start: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield raw page records from a space, fetching ``page_size`` at a time."""
+        space_key = self._space_key(space)
+        while True:
+            batch = self._client.get_all_pages_from_space(
+                space_key,
+                start=start,
+                limit=page_size,
+                expand="",
+                content_type="page",
+            )
+            if not batch:
+                return
+            yield from batch
+            if len(batch) < page_size:
+                return
+            start += len(batch)
+
+    @cached_read(SHORT_CACHE_TTL)
     def list_pages(
         self,
         space: Annotated[str, Field(description="Confluence space key (e.g., 'ENG').")],
         limit: Annotated[int, Field(description="Maximum number of pages to fetch.", ge=1, le=200)] = 50,
+        start: Annotated[int, Field(description="Offset to resume from (the previous next_cursor).", ge=0)] = 0,
     ) -> Dict[str, Any]:
         try:
-            space_key = self._space_key(space)
-            pages = self._client.get_all_pages_from_space(
-                space_key,
-                start=0,
-                limit=int(limit),
-                content_type="page",
-            )
+            limit = int(limit)
+            start = int(start)
+            pages = islice(self.iter_pages(space, page_size=min(limit, PAGE_BATCH_SIZE), start=start), limit)
             results = [
                 {
                     "id": page.get("id"),
                     "title": page.get("title"),
                     "url": f"{self._base_url}{page.get('_links', {}).get('webui', '')}",
                 }
-                for page in pages or []
+                for page in pages
             ]
-            return {"ok": True, "pages": results}
+            # A full batch means there may be more; the agent can resume from next_cursor.
+            next_cursor = start + len(results) if len(results) == limit else None
+            return {"ok": True, "pages": results, "next_cursor": next_cursor}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to list pages in {space}: {exc}"}
 
+    @cached_read(SHORT_CACHE_TTL)
     def get_page(
         self,
         space: Annotated[str, Field(description="Confluence space key.")],
         title: Annotated[str, Field(description="Page title to retrieve.")],
         expand: Annotated[str, Field(description="Expand clause.")] = "body.storage",
+        include_body: Annotated[bool, Field(description="Include the page body; turn off for metadata-only lookups.")] = True,
     ) -> Dict[str, Any]:
         try:
             space_key = self._space_key(space)
-            page = self._client.get_page_by_title(space_key, title, expand=expand)
+            parts = [part for part in expand.split(",") if part]
+            body_expand = ",".join(part for part in parts if part.startswith("body"))
+            # Look the page up without its body; the version tells us whether a
+            # previously fetched body is still current.
+            meta_expand = ",".join([part for part in parts if not part.startswith("body")] + ["version"])
+            page = self._client.get_page_by_title(space_key, title, expand=meta_expand)
             if not page:
                 return {"ok": False, "error": f"Page '{title}' not found in space '{space}'."}
 
-            return {
-                "ok": True,
-                "page": {
-                    "id": page.get("id"),
-                    "title": page.get("title"),
-                    "url": f"{self._base_url}{page.get('_links', {}).get('webui', '')}",
-                    "version": page.get("version", {}).get("number"),
-                    "body": page.get("body", {}).get("storage", {}).get("value"),
-                },
+            version = page.get("version", {}).get("number")
+            result = {
+                "id": page.get("id"),
+                "title": page.get("title"),
+                "url": f"{self._base_url}{page.get('_links', {}).get('webui', '')}",
+                "version": version,
             }
+            if include_body:
+                result["body"] = self._page_body(page.get("id"), version, body_expand) if body_expand else None
+            return {"ok": True, "page": result}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to fetch page: {exc}"}
 
+    def get_pages_bulk(
+        self,
+        space: Annotated[str, Field(description="Confluence space key.")],
+        titles: Annotated[List[str], Field(description="Page titles to retrieve.")],
+        expand: Annotated[str, Field(description="Expand clause.")] = "body.storage",
+        include_body: Annotated[bool, Field(description="Include page bodies; turn off for metadata-only lookups.")] = True,
+    ) -> Dict[str, Any]:
+        """Fetch several pages concurrently; one failed title doesn't fail the batch."""
+        titles = list(dict.fromkeys(titles))
+        futures = [self._pool.submit(self.get_page, space, title, expand, include_body) for title in titles]
+        pages: List[Dict[str, Any]] = []
+        errors: Dict[str, str] = {}
+        for title, future in zip(titles, futures):
+            try:
+                result = future.result()
+            except Exception as exc:  # noqa: BLE001
+                result = {"ok": False, "error": f"Failed to fetch page: {exc}"}
+            if result["ok"]:
+                pages.append(result["page"])
+            else:
+                errors[title] = result["error"]
+        response: Dict[str, Any] = {"ok": bool(pages) or not errors, "pages": pages}
+        if errors:
+            response["errors"] = errors
+        return response
+
     def create_page(
         self,
         space: Annotated[str, Field(description="Space key where the page will be created.")],
@@ -138,6 +230,7 @@ class ConfluenceTool:
         try:
             space_key = self._space_key(space)
             result = self._client.create_page(space_key, title, body, parent_id=parent_id)
+            self._read_cache.clear()
             return {
                 "ok": True,
                 "page": {
@@ -157,6 +250,8 @@ class ConfluenceTool:
     ) -> Dict[str, Any]:
         try:
             result = self._client.update_page(page_id, title, body, representation="storage")
+            self._read_cache.clear()
+            self._page_bodies.pop(page_id, None)
             return {
                 "ok": True,
                 "page": {
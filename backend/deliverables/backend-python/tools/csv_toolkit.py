@@ -7,12 +7,26 @@ return structured dictionaries (`ok`, `data`, `error`) instead of raw strings.
 """
 from __future__ import annotations
 
+import asyncio
+import base64
 import csv
+import threading
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional
 from typing_extensions import Annotated
 from pydantic import Field
 
+try:
+    import sqlglot
+except ImportError:  # pragma: no cover - optional dependency
+    sqlglot = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
 SAMPLE_PROMPTS = [
     "List the available CSV datasets and summarize their columns.",
     "Read the first 20 rows from `sales_q1` and highlight top performers.",
@@ -20,6 +34,31 @@ SAMPLE_PROMPTS = [
 ]
 
 
+def _select_statement(sql_query: str) -> str:
+    """Return ``sql_query`` as a single read-only statement, or raise ``ValueError``.
+
+    DuckDB's own parser splits the query (semicolons inside string literals
+    don't count) and must find exactly one SELECT (WITH/UNION included), so user
+    SQL can't drop or rewrite the tables the toolkit keeps loaded. sqlglot, when
+    installed, only validates: the text that runs is the user's own, since
+    regenerated SQL can rename result columns (``list(a)`` -> ``array_agg(a)``).
+    """
+    import duckdb
+
+    cleaned = sql_query.replace("`", "")
+    if sqlglot is not None:
+        try:
+            statements = [stmt for stmt in sqlglot.parse(cleaned, read="duckdb") if stmt is not None]
+        except sqlglot.errors.SqlglotError:
+            statements = None  # leave it to DuckDB to report the error
+        if statements is not None and len(statements) > 1:
+            raise ValueError("Only a single SELECT (or WITH ... SELECT) statement is allowed.")
+    parsed = duckdb.extract_statements(cleaned)
+    if len(parsed) != 1 or parsed[0].type != duckdb.StatementType.SELECT:
+        raise ValueError("Only a single SELECT (or WITH ... SELECT) statement is allowed.")
+    return parsed[0].query
+
+
 class CsvToolkit:
     """
     CSV helper toolset compatible with Microsoft Agent Framework.
@@ -46,9 +85,17 @@ class CsvToolkit:
         files: Optional[Iterable[str]] = None,
         row_limit: Optional[int] = None,
         duckdb_kwargs: Optional[Dict[str, Any]] = None,
+        async_io: bool = False,
     ):
         self._sources: List[Path] = []
+        # Export the coroutine variants so file and DuckDB work runs off the event loop.
+        self.async_io = bool(async_io)
         self._duckdb_kwargs = duckdb_kwargs or {}
+        # One DuckDB connection per toolkit; each CSV is loaded into a table once
+        # and reloaded only when the file changes (identifier -> (path, mtime)).
+        self._duck = None
+        self._loaded: Dict[str, Any] = {}
+        self._duck_lock = threading.Lock()
         self.row_limit = int(row_limit) if row_limit else None
 
         for path_like in files or []:
@@ -63,19 +110,63 @@ class CsvToolkit:
 
         self._sources = sorted({p.resolve() for p in self._sources if p.exists()})
 
+        # Tools address files by stem, so stems must be unique across all sources.
+        self._by_stem: Dict[str, Path] = {}
+        for path in self._sources:
+            if path.stem in self._by_stem:
+                raise ValueError(f"Duplicate CSV stem '{path.stem}': {path} and {self._by_stem[path.stem]}")
+            self._by_stem[path.stem] = path
+        self._files_cache = [{"name": path.stem, "path": str(path)} for path in self._sources]
+
     # ------------------------------------------------------------------ #
     # Helper methods
     # ------------------------------------------------------------------ #
     def _ensure_file(self, csv_name: str) -> Optional[Path]:
-        candidates = {p.stem: p for p in self._sources}
-        return candidates.get(csv_name)
+        return self._by_stem.get(csv_name)
 
     def _limit_rows(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if self.row_limit is None:
             return rows
         return rows[: self.row_limit]
 
+    def _duckdb_cursor(self, table_identifier: str, path: Path):
+        """Return a cursor on the shared connection with ``path`` loaded as ``table_identifier``."""
+        import duckdb
+
+        with self._duck_lock:
+            if self._duck is None:
+                self._duck = duckdb.connect(**self._duckdb_kwargs)
+            state = (path, path.stat().st_mtime_ns)
+            if self._loaded.get(table_identifier) != state or not self._duck.execute(
+                "SELECT 1 FROM duckdb_tables() WHERE table_name = ?", [table_identifier]
+            ).fetchone():
+                # Identifiers can't be bound as parameters, so the table name is quoted;
+                # the file path is passed as a bound parameter.
+                quoted_table = '"' + table_identifier.replace('"', '""') + '"'
+                self._duck.execute(
+                    f"CREATE OR REPLACE TABLE {quoted_table} AS SELECT * FROM read_csv_auto(?)",
+                    [path.as_posix()],
+                )
+                self._loaded[table_identifier] = state
+            # Cursors share the database but are safe to use from separate threads.
+            return self._duck.cursor()
+
+    def __del__(self):
+        duck = getattr(self, "_duck", None)
+        if duck is not None:
+            try:
+                duck.close()
+            except Exception:
+                pass
+
     def as_tools(self):
+        if self.async_io:
+            return [
+                self.list_csv_files,
+                self.aread_csv_file,
+                self.aget_columns,
+                self.aquery_csv_file,
+            ]
         return [
             self.list_csv_files,
             self.read_csv_file,
@@ -88,11 +179,7 @@ class CsvToolkit:
     # ------------------------------------------------------------------ #
     def list_csv_files(self) -> Dict[str, Any]:
         """Return available CSV identifiers (stem names)."""
-        files = [
-            {"name": path.stem, "path": str(path)}
-            for path in self._sources
-        ]
-        return {"ok": True, "files": files}
+        return {"ok": True, "files": self._files_cache}
 
     def read_csv_file(
         self,
@@ -105,17 +192,26 @@ class CsvToolkit:
             return {"ok": False, "error": f"CSV '{csv_name}' not configured.", "available": self.list_csv_files()["files"]}
 
         limit = row_limit if row_limit is not None else self.row_limit
+        if limit is not None:
+            limit = max(0, int(limit))
+        truncated = False
         try:
+            # Building one dict per row dominates the cost here; pandas/pyarrow parse
+            # faster but their record conversion is slower, so DictReader stays.
             with path.open(newline="", encoding="utf-8") as handle:
                 reader = csv.DictReader(handle)
-                rows = list(reader)
+                if limit is None:
+                    rows = list(reader)
+                else:
+                    # Stop parsing once the limit is reached; one extra row tells us
+                    # whether the file was truncated.
+                    rows = list(islice(reader, limit + 1))
+                    truncated = len(rows) > limit
+                    del rows[limit:]
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to read '{csv_name}': {exc}"}
 
-        if limit is not None:
-            rows = rows[: max(0, int(limit))]
-
-        return {"ok": True, "rows": rows, "count": len(rows), "truncated": limit is not None and len(rows) == limit}
+        return {"ok": True, "rows": rows, "count": len(rows), "truncated": truncated}
 
     def get_columns(
         self,
@@ -139,34 +235,50 @@ class CsvToolkit:
         self,
         csv_name: Annotated[str, Field(description="Registered CSV name (file stem).")],
         sql_query: Annotated[str, Field(description="DuckDB SQL query using the CSV name as table identifier.")],
+        return_format: Annotated[
+            Literal["rows", "arrow"],
+            Field(description="'rows' for a list of records, 'arrow' for a base64 Arrow IPC stream."),
+        ] = "rows",
     ) -> Dict[str, Any]:
         """Execute a DuckDB query over a registered CSV file."""
+        if return_format not in ("rows", "arrow"):
+            return {"ok": False, "error": f"Unsupported return_format '{return_format}'."}
+        if return_format == "arrow" and pyarrow is None:
+            return {"ok": False, "error": "pyarrow is required for Arrow output. Install with `pip install pyarrow`."}
         path = self._ensure_file(csv_name)
         if not path:
             return {"ok": False, "error": f"CSV '{csv_name}' not configured.", "available": self.list_csv_files()["files"]}
 
         try:
-            import duckdb
+            import duckdb  # noqa: F401
         except ImportError:  # pragma: no cover - optional dependency
             return {"ok": False, "error": "duckdb is required for queries. Install with `pip install duckdb`."}
 
+        table_identifier = csv_name.replace("-", "_")
+
         try:
-            connection = duckdb.connect(**self._duckdb_kwargs)
+            statement = _select_statement(sql_query)
         except Exception as exc:  # noqa: BLE001
-            return {"ok": False, "error": f"Failed to open DuckDB connection: {exc}"}
+            return {"ok": False, "error": f"Query rejected: {exc}"}
 
-        table_identifier = csv_name.replace("-", "_")
+        try:
+            connection = self._duckdb_cursor(table_identifier, path)
+        except Exception as exc:  # noqa: BLE001
+            return {"ok": False, "error": f"Failed to load '{csv_name}' into DuckDB: {exc}"}
 
         try:
-            connection.execute(f"CREATE TABLE {table_identifier} AS SELECT * FROM read_csv_auto('{path.as_posix()}');")
-            formatted_sql = sql_query.replace("`", "").split(";")[0]
-            result = connection.execute(formatted_sql)
-            data = result.fetchall()
+            result = connection.execute(statement)
             columns = [col[0] for col in result.description] if result.description else []
-            records = [
-                {columns[idx]: value for idx, value in enumerate(row)}
-                for row in data
-            ]
+            if return_format == "arrow" and columns:
+                table = result.fetch_arrow_table()
+                sink = pyarrow.BufferOutputStream()
+                with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+                    writer.write_table(table)
+                payload = base64.b64encode(sink.getvalue().to_pybytes()).decode("ascii")
+                return {"ok": True, "columns": columns, "arrow_ipc": payload, "rowCount": table.num_rows}
+            # Rows come from the cursor rather than Arrow's to_pylist(), which turns
+            # HUGEINT/DECIMAL results (e.g. SUM over an integer column) into Decimal.
+            records = [dict(zip(columns, row)) for row in result.fetchall()] if columns else []
             return {"ok": True, "columns": columns, "rows": records, "rowCount": len(records)}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Query failed: {exc}"}
@@ -175,3 +287,33 @@ class CsvToolkit:
                 connection.close()
             except Exception:
                 pass
+
+    # ------------------------------------------------------------------ #
+    # Async variants (run the blocking work in a worker thread)
+    # ------------------------------------------------------------------ #
+    async def aread_csv_file(
+        self,
+        csv_name: Annotated[str, Field(description="Registered CSV name (file stem).")],
+        row_limit: Annotated[Optional[int], Field(description="Optional override row limit.")] = None,
+    ) -> Dict[str, Any]:
+        """Read rows from a registered CSV file."""
+        return await asyncio.to_thread(self.read_csv_file, csv_name, row_limit)
+
+    async def aget_columns(
+        self,
+        csv_name: Annotated[str, Field(description="Registered CSV name (file stem).")],
+    ) -> Dict[str, Any]:
+        """Return header columns for a CSV file."""
+        return await asyncio.to_thread(self.get_columns, csv_name)
+
+    async def aquery_csv_file(
+        self,
+        csv_name: Annotated[str, Field(description="Registered CSV name (file stem).")],
+        sql_query: Annotated[str, Field(description="DuckDB SQL query using the CSV name as table identifier.")],
+        return_format: Annotated[
+            Literal["rows", "arrow"],
+            Field(description="'rows' for a list of records, 'arrow' for a base64 Arrow IPC stream."),
+        ] = "rows",
+    ) -> Dict[str, Any]:
+        """Execute a DuckDB query over a registered CSV file."""
+        return await asyncio.to_thread(self.query_csv_file, csv_name, sql_query, return_format)
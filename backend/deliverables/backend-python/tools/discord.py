@@ -2,18 +2,40 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple
 from typing_extensions import Annotated
 from pydantic import Field
 
 import requests
 
+from ._http_common import build_session, cached_read, json_dumps, json_loads
+
 SAMPLE_PROMPTS = [
     "Post the deployment status message in the #release-updates channel.",
     "List the latest 20 messages from the on-call room.",
     "Delete the reminder message from channel XYZ.",
 ]
 
+# Upper bound on concurrent Discord requests issued by the bulk helpers.
+MAX_CONCURRENT_REQUESTS = 8
+# Discord returns at most 100 messages per request; older ones are paged with `before`.
+MESSAGES_PAGE_SIZE = 100
+
+# Channel lookups are cached per instance for a short TTL; messages never are.
+SHORT_CACHE_TTL = 30
+
+# 429 responses are retried after the advertised Retry-After, at most this many
+# times; waits longer than MAX_RATE_LIMIT_WAIT are surfaced as errors instead.
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 60.0
+# Snowflakes after these path segments are not major parameters for rate limiting.
+_MINOR_ID_RE = re.compile(r"(/messages|/reactions)/\d+")
+
 
 class DiscordTool:
     REQUIRED_SECRETS = ["DISCORD_BOT_TOKEN"]
@@ -27,20 +49,116 @@ class DiscordTool:
             "Authorization": f"Bot {self._token}",
             "Content-Type": "application/json",
         }
+        self._session = build_session(self._headers, MAX_CONCURRENT_REQUESTS)
+        self._read_cache: "OrderedDict[Any, Any]" = OrderedDict()
+        # Rate-limit state: route -> Discord bucket hash, bucket -> (reset epoch, remaining).
+        self._route_buckets: Dict[str, str] = {}
+        self._buckets: Dict[str, Tuple[float, int]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    @staticmethod
+    def _route_key(method: str, endpoint: str) -> str:
+        """Rate-limit route for a request: method plus path, without the query string.
+
+        Major parameters (channel, guild, webhook ids) stay in the path; other
+        ids such as message ids are collapsed, since Discord buckets them together.
+        """
+        path = endpoint.split("?", 1)[0]
+        path = _MINOR_ID_RE.sub(r"\1/{id}", path)
+        return f"{method} {path}"
+
+    def _wait_for_bucket(self, route: str) -> None:
+        """Sleep until the route's bucket resets if it has no requests left."""
+        state = self._buckets.get(self._route_buckets.get(route, route))
+        if state is None:
+            return
+        reset_at, remaining = state
+        if remaining <= 0:
+            delay = reset_at - time.time()
+            if 0 < delay <= MAX_RATE_LIMIT_WAIT:
+                time.sleep(delay)
+
+    def _update_bucket(self, route: str, response: requests.Response) -> None:
+        headers = response.headers
+        bucket = headers.get("X-RateLimit-Bucket")
+        if bucket:
+            self._route_buckets[route] = bucket
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
+        try:
+            state = (time.time() + float(reset_after), int(remaining))
+        except ValueError:
+            return
+        self._buckets[bucket or route] = state
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            try:
+                value = response.json().get("retry_after")
+            except Exception:  # noqa: BLE001
+                value = None
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            return 1.0
 
     def _request(
         self,
         method: str,
         endpoint: str,
         payload: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if method != "GET":
+            return self._send(method, endpoint, payload)
+        # Concurrent identical GETs share the one request already in flight.
+        with self._inflight_lock:
+            future = self._inflight.get(endpoint)
+            leader = future is None
+            if leader:
+                future = self._inflight[endpoint] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = self._send(method, endpoint, payload)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(endpoint, None)
+        return result
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         url = f"{self._base}{endpoint}"
+        route = self._route_key(method, endpoint)
         try:
-            response = requests.request(method, url, headers=self._headers, json=payload, timeout=30)
+            body = json_dumps(payload) if payload is not None else None
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                self._wait_for_bucket(route)
+                response = self._session.request(method, url, data=body, timeout=30)
+                self._update_bucket(route, response)
+                if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                    break
+                delay = self._retry_after(response)
+                if delay > MAX_RATE_LIMIT_WAIT:
+                    break
+                time.sleep(delay)
             if response.status_code == 204:
                 return {"ok": True}
             response.raise_for_status()
-            return {"ok": True, "data": response.json()}
+            return {"ok": True, "data": json_loads(response.content)}
         except requests.exceptions.HTTPError as exc:
             detail = None
             try:
@@ -51,6 +169,14 @@ class DiscordTool:
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Discord request failed: {exc}"}
 
+    @staticmethod
+    def _fan_out(fn: Callable[[str], Dict[str, Any]], items: List[str]) -> List[Dict[str, Any]]:
+        """Run independent requests concurrently, preserving input order."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(items))) as pool:
+            return list(pool.map(fn, items))
+
     # ------------------------------------------------------------------ #
     # Tools
     # ------------------------------------------------------------------ #
@@ -61,12 +187,32 @@ class DiscordTool:
     ) -> Dict[str, Any]:
         return self._request("POST", f"/channels/{channel_id}/messages", {"content": content})
 
+    @cached_read(SHORT_CACHE_TTL)
     def get_channel_info(
         self,
         channel_id: Annotated[str, Field(description="Channel identifier.")],
     ) -> Dict[str, Any]:
         return self._request("GET", f"/channels/{channel_id}")
 
+    def get_channels_info(
+        self,
+        channel_ids: Annotated[List[str], Field(description="Channel identifiers.")],
+    ) -> Dict[str, Any]:
+        """Fetch several channels concurrently instead of one round trip at a time."""
+        channel_ids = list(dict.fromkeys(channel_ids))
+        channels: Dict[str, Any] = {}
+        errors: Dict[str, Any] = {}
+        for channel_id, result in zip(channel_ids, self._fan_out(self.get_channel_info, channel_ids)):
+            if result["ok"]:
+                channels[channel_id] = result["data"]
+            else:
+                errors[channel_id] = result["error"]
+        response: Dict[str, Any] = {"ok": bool(channels) or not errors, "channels": channels}
+        if errors:
+            response["errors"] = errors
+        return response
+
+    @cached_read(SHORT_CACHE_TTL)
     def list_channels(
         self,
         guild_id: Annotated[str, Field(description="Guild (server) identifier.")],
@@ -81,23 +227,62 @@ class DiscordTool:
         ]
         return {"ok": True, "channels": channels}
 
+    def _message_pages(
+        self, channel_id: str, total: int, before: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield raw request results, newest first, until ``total`` messages are read."""
+        fetched = 0
+        while fetched < total:
+            batch = min(MESSAGES_PAGE_SIZE, total - fetched)
+            endpoint = f"/channels/{channel_id}/messages?limit={batch}"
+            if before:
+                endpoint += f"&before={before}"
+            result = self._request("GET", endpoint)
+            yield result
+            page = result.get("data") if result["ok"] else None
+            if not page or len(page) < batch:
+                return
+            fetched += len(page)
+            before = page[-1]["id"]
+
+    def iter_channel_messages(
+        self, channel_id: str, total: int = 500, before: Optional[str] = None
+    ) -> Generator[Dict[str, Any], None, Optional[Dict[str, Any]]]:
+        """Yield up to ``total`` raw messages, newest first, one request per 100.
+
+        A failed page stops the walk; its ``{"ok": False, ...}`` result is the
+        generator's return value (``None`` when every page succeeded).
+        """
+        for result in self._message_pages(channel_id, int(total), before):
+            if not result["ok"]:
+                return result
+            yield from result.get("data") or []
+        return None
+
     def get_channel_messages(
         self,
         channel_id: Annotated[str, Field(description="Channel identifier.")],
-        limit: Annotated[int, Field(description="Maximum number of messages.", ge=1, le=100)] = 20,
+        limit: Annotated[int, Field(description="Maximum number of messages.", ge=1, le=500)] = 20,
+        before: Annotated[Optional[str], Field(description="Only return messages older than this message id (resume cursor).")] = None,
     ) -> Dict[str, Any]:
-        result = self._request("GET", f"/channels/{channel_id}/messages?limit={int(limit)}")
-        if not result["ok"]:
-            return result
-        messages = [
-            {
-                "id": msg["id"],
-                "author": msg.get("author", {}).get("username"),
-                "content": msg.get("content"),
-                "timestamp": msg.get("timestamp"),
-            }
-            for msg in result["data"]
-        ]
+        messages: List[Dict[str, Any]] = []
+        for result in self._message_pages(channel_id, int(limit), before):
+            if not result["ok"]:
+                # Keep the pages already read; `before` resumes the walk after them.
+                return {
+                    **result,
+                    "messages": messages,
+                    "before": messages[-1]["id"] if messages else before,
+                }
+            messages.extend(
+                {
+                    "id": msg["id"],
+                    "author": msg.get("author", {}).get("username"),
+                    "content": msg.get("content"),
+                    "timestamp": msg.get("timestamp"),
+                }
+                for msg in result.get("data") or []
+            )
         return {"ok": True, "messages": messages}
 
     def delete_message(
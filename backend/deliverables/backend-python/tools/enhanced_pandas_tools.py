@@ -1,9 +1,13 @@
+import importlib.util
 from typing import Dict, Any, List
 from typing_extensions import Annotated
 from pydantic import Field, BaseModel
 import pandas as pd
 from .pandas_tools import PandasTools
 
+# DataFrame.to_markdown needs the optional `tabulate` package; check once.
+_HAS_TABULATE = importlib.util.find_spec("tabulate") is not None
+
 # Explicit Pydantic models to avoid forward reference issues
 class DataFrameCreateInput(BaseModel):
     dataframe_name: str = Field(description="Name for the DataFrame")
@@ -22,6 +26,7 @@ class QuickSummaryInput(BaseModel):
 class EnhancedPandasTools:
     def __init__(self):
         self.pt = PandasTools()
+        self._tools_cache: List[object] = [self.create_pandas_dataframe, self.run_dataframe_operation, self.quick_summary]
 
     def create_pandas_dataframe(self, input_data: DataFrameCreateInput) -> Dict[str, Any]:
         """Create a pandas DataFrame using specified reader function"""
@@ -47,21 +52,26 @@ class EnhancedPandasTools:
         
         df: pd.DataFrame = frames[input_data.dataframe_name]
         dtypes = {c: str(t) for c, t in df.dtypes.items()}
-        nulls = {c: int(df[c].isna().sum()) for c in df.columns}
+        # One vectorized pass over all columns instead of a pandas call per column
+        nulls = dict(zip(df.columns, df.isna().sum().tolist()))
         head = df.head(input_data.show_head)
         
-        try:
-            head_txt = head.to_markdown(index=False)
-        except Exception:
+        head_txt = None
+        if _HAS_TABULATE:
+            try:
+                head_txt = head.to_markdown(index=False)
+            except Exception:
+                pass
+        if head_txt is None:
             head_txt = head.to_string(index=False)
         
         return {
             "ok": True, 
-            "shape": [int(df.shape[0]), int(df.shape[1])], 
+            "shape": list(df.shape), 
             "dtypes": dtypes, 
             "nulls": nulls, 
             "head": head_txt
         }
 
     def as_tools(self) -> List[object]:
-        return [self.create_pandas_dataframe, self.run_dataframe_operation, self.quick_summary]
+        return self._tools_cache
@@ -14,6 +14,9 @@ SAMPLE_PROMPTS = [
     "Run a JQL query for open incidents assigned to the platform team.",
 ]
 
+# Only the fields _issue_summary reads are requested from the server.
+SUMMARY_FIELDS = "summary,status,project,assignee,reporter"
+
 
 class JiraTool:
     REQUIRED_SECRETS = ["JIRA_SERVER_URL", "JIRA_USERNAME", "JIRA_API_TOKEN"]
@@ -42,21 +45,23 @@ class JiraTool:
             )
 
         self._client = JIRA(server=self._server, basic_auth=(self._username, self._token))
+        self._browse_url = f"{self._server}/browse/"
 
     # ------------------------------------------------------------------ #
     # Helper
     # ------------------------------------------------------------------ #
     @staticmethod
-    def _issue_summary(issue: Any) -> Dict[str, Any]:
-        fields = issue.fields
+    def _issue_summary(issue: Any, browse_url: str) -> Dict[str, Any]:
+        # Read the raw REST payload once instead of walking the SDK's resource objects
+        fields = issue.raw.get("fields") or {}
         return {
             "key": issue.key,
-            "summary": fields.summary,
-            "status": getattr(fields.status, "name", None),
-            "project": getattr(fields.project, "key", None),
-            "assignee": getattr(getattr(fields, "assignee", None), "displayName", None),
-            "reporter": getattr(getattr(fields, "reporter", None), "displayName", None),
-            "url": None,
+            "summary": fields.get("summary"),
+            "status": (fields.get("status") or {}).get("name"),
+            "project": (fields.get("project") or {}).get("key"),
+            "assignee": (fields.get("assignee") or {}).get("displayName"),
+            "reporter": (fields.get("reporter") or {}).get("displayName"),
+            "url": browse_url + issue.key,
         }
 
     # ------------------------------------------------------------------ #
@@ -67,10 +72,9 @@ class JiraTool:
         issue_key: Annotated[str, Field(description="Issue key (e.g., ENG-123).")],
     ) -> Dict[str, Any]:
         try:
-            issue = self._client.issue(issue_key)
-            summary = self._issue_summary(issue)
-            summary["description"] = issue.fields.description or ""
-            summary["url"] = f"{self._server}/browse/{issue.key}"
+            issue = self._client.issue(issue_key, fields=f"{SUMMARY_FIELDS},description")
+            summary = self._issue_summary(issue, self._browse_url)
+            summary["description"] = issue.raw.get("fields", {}).get("description") or ""
             return {"ok": True, "issue": summary}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to fetch issue {issue_key}: {exc}"}
@@ -94,7 +98,7 @@ class JiraTool:
                 "ok": True,
                 "issue": {
                     "key": issue.key,
-                    "url": f"{self._server}/browse/{issue.key}",
+                    "url": self._browse_url + issue.key,
                 },
             }
         except Exception as exc:  # noqa: BLE001
@@ -106,12 +110,9 @@ class JiraTool:
         max_results: Annotated[int, Field(description="Maximum results.", ge=1, le=200)] = 50,
     ) -> Dict[str, Any]:
         try:
-            issues = self._client.search_issues(jql, maxResults=int(max_results))
-            summaries = []
-            for issue in issues:
-                data = self._issue_summary(issue)
-                data["url"] = f"{self._server}/browse/{issue.key}"
-                summaries.append(data)
+            issues = self._client.search_issues(jql, maxResults=int(max_results), fields=SUMMARY_FIELDS)
+            browse_url = self._browse_url
+            summaries = [self._issue_summary(issue, browse_url) for issue in issues]
             return {"ok": True, "issues": summaries}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to search issues: {exc}", "jql": jql}
@@ -1,11 +1,13 @@
 # app/agents/tools/neo4j_tool.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from typing_extensions import Annotated
 from pydantic import Field
 
+import copy
 import os
 import re
+import time
 
 # pip install neo4j
 try:
@@ -13,12 +15,28 @@ try:
 except ImportError as e:
     raise ImportError("`neo4j` package is required. Install with: pip install neo4j") from e
 
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_LINE_COMMENT_RE = re.compile(r"//.*?$", re.M)
+# Mutating Cypher clauses (DETACH DELETE is covered by DELETE)
+_WRITE_KW_RE = re.compile(r"\b(?:create|merge|delete|set|remove|call\s+dbms|load\s+csv)\b", re.I)
+
+# Labels, relationship types and the schema visualization in one round trip.
+# Each collect() runs in its own subquery without grouping keys, so it always yields a
+# row (an empty list when the procedure returns nothing) and the query returns one record.
+_FULL_SCHEMA_QUERY = """
+CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+CALL { CALL db.relationshipTypes() YIELD relationshipType RETURN collect(relationshipType) AS relationshipTypes }
+CALL db.schema.visualization() YIELD nodes, relationships
+RETURN labels, relationshipTypes, nodes, relationships
+"""
+SCHEMA_CACHE_TTL_SEC = 60
+
 
 class Neo4jTool:
     """
     Microsoft Agent Framework (MAF) compatible Neo4j tool.
 
-    - Exposes MAF function tools: list_labels, list_relationship_types, get_schema, run_cypher_query
+    - Exposes MAF function tools: get_full_schema, list_labels, list_relationship_types, get_schema, run_cypher_query
     - Read-first guardrails; writes disabled by default (allow_writes=False)
     - Works with Neo4j Aura, self-hosted bolt/neo4j schemes, and NEO4J_* env vars.
 
@@ -66,6 +84,8 @@ class Neo4jTool:
         self.timeout_sec = int(timeout_sec or os.getenv("NEO4J_TIMEOUT_SEC", "15"))
 
         self._driver = GraphDatabase.driver(self.uri, auth=basic_auth(self.user, self.password))
+        # (fetched_at, schema) from _full_schema(); dropped after writes
+        self._schema_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         if verify_connectivity:
             self._driver.verify_connectivity()
 
@@ -81,47 +101,70 @@ class Neo4jTool:
     @staticmethod
     def _looks_like_write(query: str) -> bool:
         """Heuristic to detect write operations when mode='auto' or 'write'."""
-        q = re.sub(r"/\*.*?\*/", "", query or "", flags=re.S).strip().lower()  # strip /* */ comments
-        q = re.sub(r"//.*?$", "", q, flags=re.M)  # strip // comments
+        q = _BLOCK_COMMENT_RE.sub("", query or "")  # strip /* */ comments
+        q = _LINE_COMMENT_RE.sub("", q)  # strip // comments
         # crude detection of mutating Cypher
-        keywords = ("create ", "merge ", "delete ", "detach delete", "set ", "remove ", "call dbms", "load csv")
-        return any(kw in q for kw in keywords)
+        return bool(_WRITE_KW_RE.search(q))
+
+    def _full_schema(self) -> Dict[str, Any]:
+        """Fetch labels, relationship types and schema in one query, cached for SCHEMA_CACHE_TTL_SEC.
+
+        Callers get a deep copy, so mutating a result can't change the cached schema.
+        """
+        cached = self._schema_cache
+        if cached is not None and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL_SEC:
+            return copy.deepcopy(cached[1])
+        with self._driver.session(database=self.database) as session:
+            record = session.run(_FULL_SCHEMA_QUERY).single()
+        row = record.data() if record is not None else {}
+        schema = {
+            # collect() already skips nulls, so the lists are used as returned
+            "labels": row.get("labels") or [],
+            "relationship_types": row.get("relationshipTypes") or [],
+            "schema": {"nodes": row.get("nodes") or [], "relationships": row.get("relationships") or []},
+        }
+        self._schema_cache = (time.monotonic(), schema)
+        return copy.deepcopy(schema)
 
     def _tx_run(self, tx, query: str, params: Optional[Dict[str, Any]], max_rows: int) -> List[Dict[str, Any]]:
         res = tx.run(query, **(params or {}))
-        data = res.data()
-        if max_rows > 0:
-            data = data[:max_rows]
+        if max_rows <= 0:
+            return res.data()
+        data: List[Dict[str, Any]] = []
+        for record in res:
+            data.append(record.data())
+            if len(data) >= max_rows:
+                break
+        # Discard the rest of the stream instead of pulling it to the client
+        res.consume()
         return data
 
     # ------------------------
     #  Tools exposed to MAF
     # ------------------------
+    def get_full_schema(self) -> Dict[str, Any]:
+        """
+        Return labels, relationship types and schema visualization in a single call.
+        """
+        return self._full_schema()
+
     def list_labels(self) -> List[str]:
         """
         Return all node labels in the database.
         """
-        with self._driver.session(database=self.database, fetch_size=1000) as session:
-            records = session.run("CALL db.labels()")
-            return [r.get("label") for r in records if r.get("label") is not None]
+        return self._full_schema()["labels"]
 
     def list_relationship_types(self) -> List[str]:
         """
         Return all relationship types in the database.
         """
-        with self._driver.session(database=self.database, fetch_size=1000) as session:
-            records = session.run("CALL db.relationshipTypes()")
-            return [r.get("relationshipType") for r in records if r.get("relationshipType") is not None]
+        return self._full_schema()["relationship_types"]
 
     def get_schema(self) -> Dict[str, Any]:
         """
         Return schema visualization (nodes & relationships) from db.schema.visualization().
         """
-        with self._driver.session(database=self.database, fetch_size=1000) as session:
-            result = session.run("CALL db.schema.visualization()")
-            data = result.data()
-            # usually single row with 'nodes' and 'relationships'
-            return data[0] if data else {"nodes": [], "relationships": []}
+        return self._full_schema()["schema"]
 
     def run_cypher_query(
         self,
@@ -156,11 +199,14 @@ class Neo4jTool:
             if effective_mode == "write" and not self.allow_writes:
                 return {"ok": False, "mode": "write", "count": 0, "data": [], "error": "Writes are disabled (allow_writes=False)."}
 
-            with self._driver.session(database=self.database) as session:
+            # Pull records in batches no larger than the cap so the server stops streaming early
+            fetch_size = min(max_rows, 1000) if max_rows > 0 else 1000
+            with self._driver.session(database=self.database, fetch_size=fetch_size) as session:
                 if effective_mode == "read":
                     data = session.execute_read(self._tx_run, query, params, max_rows)
                 else:
                     data = session.execute_write(self._tx_run, query, params, max_rows)
+                    self._schema_cache = None
 
             return {"ok": True, "mode": effective_mode, "count": len(data), "data": data}
         except Exception as e:
@@ -174,6 +220,7 @@ class Neo4jTool:
         Return a list of callables suitable for MAF's ChatAgent(tools=[...]).
         """
         return [
+            self.get_full_schema,
             self.list_labels,
             self.list_relationship_types,
             self.get_schema,
@@ -1,15 +1,56 @@
 # app/agents/tools/newspaper_tool.py
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from typing_extensions import Annotated
 from pydantic import Field
 
-# pip install newspaper3k lxml_html_clean
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urldefrag
+
+# pip install newspaper3k lxml_html_clean (optional: trafilatura for faster, cleaner extraction)
 try:
     from newspaper import Article
 except ImportError as e:
     raise ImportError("`newspaper3k` is required. Install with: pip install newspaper3k lxml_html_clean") from e
 
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None  # optional - newspaper3k extracts the text instead
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Parsed articles are cached in memory and on disk for a day, keyed by (url, max_chars, fetch_images).
+ARTICLE_CACHE_TTL_SEC = 24 * 3600
+ARTICLE_CACHE_MAX_ENTRIES = 256
+DEFAULT_CACHE_DIR = "~/.cache/newspaper_tool"
+
+ARTICLE_FETCH_TIMEOUT_SEC = 15
+# Upper bound on concurrent downloads in get_articles
+MAX_CONCURRENT_FETCHES = 8
+_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+
+def _build_session() -> requests.Session:
+    """Keep-alive session shared by every NewspaperTool instance."""
+    session = requests.Session()
+    session.headers.update(_FETCH_HEADERS)
+    adapter = HTTPAdapter(pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class NewspaperTool:
     """
@@ -29,32 +70,158 @@ class NewspaperTool:
         )
         # await agent.run("Fetch the article text from <URL> and summarize the main reasons mentioned.")
 
+    Parsed articles are cached for ``cache_ttl`` seconds, in memory and (unless
+    ``cache_dir`` is set to "") as JSON files under ``cache_dir``
+    (default: $NEWSPAPER_TOOL_CACHE_DIR or ~/.cache/newspaper_tool).
+    Hosts listed in ``warm_hosts`` are connected to in the background on init.
     """
 
+    _SESSION = _build_session()
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = ARTICLE_CACHE_TTL_SEC,
+        warm_hosts: Optional[List[str]] = None,
+    ) -> None:
+        self.cache_ttl = cache_ttl
+        if cache_dir is None:
+            cache_dir = os.getenv("NEWSPAPER_TOOL_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        if warm_hosts:
+            threading.Thread(target=self._warm_up, args=(list(warm_hosts),), name="newspaper-warm-up", daemon=True).start()
+
+    # ---- Article cache -------------------------------------------------------
+
+    @staticmethod
+    def _cache_key(url: str, max_chars: int, fetch_images: bool) -> str:
+        normalized = urldefrag(url.strip())[0]
+        return hashlib.sha1(f"{normalized}|{max_chars}|{int(bool(fetch_images))}".encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if now - entry[0] < self.cache_ttl:
+                    self._cache.move_to_end(key)
+                    return dict(entry[1])
+                del self._cache[key]
+        if self._cache_dir is None:
+            return None
+        try:
+            stored = json.loads((self._cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        stored_at = stored.get("stored_at", 0)
+        if now - stored_at >= self.cache_ttl:
+            return None
+        self._remember(key, stored_at, stored["payload"])
+        return dict(stored["payload"])
+
+    def _remember(self, key: str, stored_at: float, payload: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._cache[key] = (stored_at, payload)
+            self._cache.move_to_end(key)
+            while len(self._cache) > ARTICLE_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _cache_put(self, key: str, payload: Dict[str, Any]) -> None:
+        if self.cache_ttl <= 0:
+            return
+        stored_at = time.time()
+        self._remember(key, stored_at, dict(payload))
+        if self._cache_dir is None:
+            return
+        try:
+            # Write to a temp file and rename so readers never see a partial entry
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            tmp_path.write_text(json.dumps({"stored_at": stored_at, "payload": payload}), encoding="utf-8")
+            os.replace(tmp_path, self._cache_dir / f"{key}.json")
+        except OSError:
+            pass  # the on-disk cache is best effort
+
+    # ---- Fetch / extract ------------------------------------------------------
+
+    @classmethod
+    def _warm_up(cls, hosts: List[str]) -> None:
+        """Open pooled connections to frequently used article hosts ahead of the first fetch."""
+        for host in hosts:
+            url = host if "://" in host else f"https://{host}/"
+            try:
+                cls._SESSION.head(url, timeout=ARTICLE_FETCH_TIMEOUT_SEC)
+            except Exception:
+                pass  # warm-up is best effort
+
+    @staticmethod
+    def _extract(url: str, response: requests.Response) -> Tuple[Optional[str], str, Optional[str]]:
+        """Return (title, text, top_image), preferring trafilatura and falling back to newspaper3k."""
+        if trafilatura is not None:
+            # trafilatura detects the document encoding itself, so it gets the raw bytes
+            text = trafilatura.extract(response.content, url=url, include_comments=False)
+            if text:
+                meta = trafilatura.extract_metadata(response.content, default_url=url)
+                return getattr(meta, "title", None), text, getattr(meta, "image", None)
+        art = Article(url)
+        art.download(input_html=response.text)
+        art.parse()
+        return getattr(art, "title", None), art.text or "", getattr(art, "top_image", None)
+
+    # ---- Tools -----------------------------------------------------------------
+
     def get_article_text(
         self,
         url: Annotated[str, Field(description="HTTP/HTTPS URL of the article.")],
         fetch_images: Annotated[bool, Field(description="Whether to parse top image.")] = False,
         max_chars: Annotated[int, Field(ge=256, le=200000, description="Max characters to return.")] = 20000,
+        force_refresh: Annotated[bool, Field(description="Bypass the cache and re-download the article.")] = False,
     ) -> Dict[str, Any]:
+        key = self._cache_key(url, max_chars, fetch_images)
+        if not force_refresh:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
         try:
-            art = Article(url)
-            art.download()
-            art.parse()
-            text = (art.text or "").strip()
+            response = self._SESSION.get(url, timeout=ARTICLE_FETCH_TIMEOUT_SEC)
+            response.raise_for_status()
+            title, text, top_image = self._extract(url, response)
+            text = (text or "").strip()
             if max_chars and len(text) > max_chars:
-                text = text[:max_chars] + "…"
+                # Keep the result, ellipsis included, within max_chars
+                text = text[:max_chars - 1] + "\u2026"
             payload = {
                 "ok": True,
                 "url": url,
-                "title": getattr(art, "title", None),
+                "title": title,
                 "text": text,
             }
             if fetch_images:
-                payload["top_image"] = getattr(art, "top_image", None)
+                payload["top_image"] = top_image
+            self._cache_put(key, payload)
             return payload
         except Exception as e:
             return {"ok": False, "url": url, "error": str(e)}
 
+    def get_articles(
+        self,
+        urls: Annotated[List[str], Field(description="HTTP/HTTPS URLs of the articles.")],
+        fetch_images: Annotated[bool, Field(description="Whether to parse top images.")] = False,
+        max_chars: Annotated[int, Field(ge=256, le=200000, description="Max characters to return per article.")] = 20000,
+        max_concurrency: Annotated[int, Field(ge=1, le=MAX_CONCURRENT_FETCHES, description="Maximum parallel downloads.")] = MAX_CONCURRENT_FETCHES,
+    ) -> Dict[str, Any]:
+        """Fetch several articles concurrently; one failed URL doesn't fail the batch."""
+        urls = list(dict.fromkeys(urls))
+        workers = min(int(max_concurrency), MAX_CONCURRENT_FETCHES, len(urls))
+        if workers <= 1:
+            articles = [self.get_article_text(url, fetch_images, max_chars) for url in urls]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                articles = list(pool.map(lambda url: self.get_article_text(url, fetch_images, max_chars), urls))
+        ok = any(article["ok"] for article in articles) or not articles
+        return {"ok": ok, "count": len(articles), "articles": articles}
+
     def as_tools(self) -> List[object]:
-        return [self.get_article_text]
+        return [self.get_article_text, self.get_articles]
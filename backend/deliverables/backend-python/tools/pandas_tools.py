@@ -3,12 +3,27 @@ from typing import Any, Dict, List
 from typing_extensions import Annotated
 from pydantic import Field
 import os
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None  # optional - readers keep pandas' default engines
+
+_PANDAS_2 = int(pd.__version__.split(".")[0]) >= 2
+
 class PandasTools:
     ALLOWED_CREATE_FUNCS = {"read_csv","read_json","read_parquet","read_excel"}
     ALLOWED_DF_METHODS = {"head","tail","describe","rename","astype","drop","dropna","fillna","sort_values","to_markdown","to_json","to_csv"}
+    # Unbound DataFrame methods resolved once; calls skip the per-call attribute lookup on the frame
+    _METHOD_TABLE = {m: getattr(pd.DataFrame, m) for m in ALLOWED_DF_METHODS}
     BASE_DATA_DIR = os.getenv("PANDAS_TOOLS_BASE_DIR")
+    # Compact dtypes on load: categorical/arrow strings and downcast integers
+    SHRINK_DTYPES = os.getenv("PANDAS_TOOLS_SHRINK") == "1"
+    # Read with pyarrow engines (faster, but dtypes differ from pandas' defaults: ISO date
+    # columns come back as datetimes, so to_json writes epoch ms; parquet strings are arrow-backed)
+    FAST_IO = os.getenv("PANDAS_TOOLS_FAST_IO") == "1"
 
     def __init__(self):
         self._frames: Dict[str, pd.DataFrame] = {}
@@ -20,14 +35,59 @@ class PandasTools:
             raise PermissionError(f"Access outside base dir is not allowed: {path}")
         return norm
 
-    def _to_text(self, obj: Any, max_chars: int = 20000) -> str:
+    @staticmethod
+    def _fast_io_params(func: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Reader kwargs selecting pyarrow engines; anything the caller passed explicitly wins."""
+        if pyarrow is None: return {}
+        fast: Dict[str, Any] = {}
+        if func == "read_csv":
+            fast["engine"] = "pyarrow"  # multi-threaded parse
+        elif func == "read_parquet":
+            fast["engine"] = "pyarrow"
+            if _PANDAS_2: fast["dtype_backend"] = "pyarrow"  # arrow strings instead of Python objects
+        elif func == "read_json" and params.get("lines") and isinstance(params.get("path_or_buf"), str):
+            fast["engine"] = "pyarrow"  # pandas only supports it for JSON Lines files
+        return {k: v for k, v in fast.items() if k not in params}
+
+    @staticmethod
+    def _shrink_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """Store text columns as category (low cardinality) or arrow strings, and downcast integer columns."""
+        n = len(df)
+        for col in df.columns:
+            s = df[col]
+            if s.dtype == object or isinstance(s.dtype, pd.StringDtype):
+                if s.dtype == object and pd.api.types.infer_dtype(s, skipna=True) != "string": continue  # mixed objects stay as-is
+                if s.nunique(dropna=True) < 0.5 * n: df[col] = s.astype("category")
+                elif pyarrow is not None and _PANDAS_2 and getattr(s.dtype, "storage", None) != "pyarrow":
+                    df[col] = s.astype(pd.ArrowDtype(pyarrow.string()))
+            elif isinstance(s.dtype, np.dtype) and s.dtype.kind in "iu":
+                df[col] = pd.to_numeric(s, downcast="integer" if s.dtype.kind == "i" else "unsigned")
+        return df
+
+    @staticmethod
+    def _render(obj: Any) -> str:
         try:
-            if hasattr(obj, "to_markdown"): txt = obj.to_markdown(index=False)
-            elif hasattr(obj, "to_string"): txt = obj.to_string()
-            else: txt = str(obj)
+            if hasattr(obj, "to_markdown"): return obj.to_markdown(index=False)
+            if hasattr(obj, "to_string"): return obj.to_string()
         except Exception:
-            txt = str(obj)
-        return txt if len(txt) <= max_chars else (txt[:max_chars] + "\n... [truncated]")
+            pass
+        return str(obj)
+
+    def _to_text(self, obj: Any, max_chars: int = 20000) -> str:
+        # For big results, estimate the rendered width from a sample and only format the
+        # rows that fit in max_chars; to_markdown is slow per cell. Results that fit render in full.
+        rows = obj.shape[0] if hasattr(obj, "shape") and hasattr(obj, "head") else 0
+        note = ""
+        if rows > 200:
+            sample = 20
+            widest = max(len(self._render(obj.head(sample))), len(self._render(obj.tail(sample))))
+            per_row = max((widest + 1) / (sample + 2), 1.0)  # chars per line incl. newline; +2 header lines
+            fits = int(max_chars // per_row) - 3  # header lines plus one row of headroom
+            if rows > fits:
+                shown = max(10, fits)
+                obj, note = obj.head(shown), f"\n... [truncated {rows - shown} rows]"
+        txt = self._render(obj)
+        return (txt + note) if len(txt) <= max_chars else (txt[:max_chars] + "\n... [truncated]")
 
     def create_pandas_dataframe(self, dataframe_name: Annotated[str, Field(description="Name for the DataFrame")], create_using_function: Annotated[str, Field(description="One of read_csv/read_json/read_parquet/read_excel")], function_parameters: Annotated[Dict[str, Any], Field(description="kwargs for pandas reader")]) -> Dict[str, Any]:
         try:
@@ -40,9 +100,16 @@ class PandasTools:
                 if key in params and isinstance(params[key], str):
                     params[key] = self._coerce_path(params[key])
             reader = getattr(pd, create_using_function)
-            df = reader(**params)
-            if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+            fast = self._fast_io_params(create_using_function, params) if self.FAST_IO else {}
+            try:
+                df = reader(**params, **fast)
+            except (ValueError, TypeError, ImportError):
+                # The pyarrow engines reject some options (nrows, chunksize, ...); retry with the defaults
+                if not fast: raise
+                df = reader(**params)
+            if not isinstance(df, pd.DataFrame) or 0 in df.shape:
                 return {"ok": False, "error":"Failed to create non-empty DataFrame"}
+            if self.SHRINK_DTYPES: df = self._shrink_dtypes(df)
             self._frames[dataframe_name] = df
             return {"ok": True, "dataframe_name": dataframe_name, "shape": [int(df.shape[0]), int(df.shape[1]) ]}
         except Exception as e:
@@ -52,10 +119,11 @@ class PandasTools:
         try:
             if dataframe_name not in self._frames:
                 return {"ok": False, "error": f"Unknown DataFrame: {dataframe_name}"}
-            if operation not in self.ALLOWED_DF_METHODS:
+            method = self._METHOD_TABLE.get(operation)
+            if method is None:
                 return {"ok": False, "error": f"Operation '{operation}' not allowed"}
             df = self._frames[dataframe_name]
-            out = getattr(df, operation)(**(operation_parameters or {}))
+            out = method(df, **(operation_parameters or {}))
             txt = self._to_text(out if hasattr(out,"head") else out)
             shape = [int(out.shape[0]), int(getattr(out,"shape",[0,0])[1])] if hasattr(out,"shape") else [0,0]
             return {"ok": True, "result": txt, "shape": shape}
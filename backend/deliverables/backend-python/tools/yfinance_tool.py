@@ -1,27 +1,318 @@
 # app/agents/tools/yfinance_tool.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from typing_extensions import Annotated
 from pydantic import Field
+import asyncio
 import datetime as _dt
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote
 
-# pip install yfinance
 try:
-    import yfinance as yf
-except ImportError as e:
-    raise ImportError("`yfinance` is required. Install with: pip install yfinance") from e
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# yfinance (and with it pandas/numpy) is imported on first use, so loading this module stays cheap.
+_yf = None
+
+
+def _load_yf():
+    global _yf
+    if _yf is None:
+        # pip install yfinance
+        try:
+            import yfinance
+        except ImportError as e:
+            raise ImportError("`yfinance` is required. Install with: pip install yfinance") from e
+        _yf = yfinance
+    return _yf
+
+
+# Process-wide caches shared by every YFinanceTool instance, so repeated lookups within a
+# conversation don't go back to Yahoo. Quote data (.info/.fast_info, news and analyst
+# recommendations) gets a short TTL.
+TICKER_CACHE_TTL_SEC = 3600
+INFO_CACHE_TTL_SEC = int(os.getenv("YFINANCE_INFO_CACHE_TTL_SEC", "120"))
+HISTORY_CACHE_TTL_SEC = 300
+CACHE_MAX_ENTRIES = 256
+
+_CACHE_LOCK = threading.Lock()
+_TICKER_CACHE: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_INFO_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_FAST_INFO_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_HIST_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
+_PROFILE_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_QUOTE_ATTR_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+
+# quoteSummary modules holding every field get_company_info/get_stock_fundamentals read.
+# .info requests a similar module list plus the v7 quote and a fundamentals-timeseries call.
+_QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/"
+PROFILE_MODULES = ("financialData", "defaultKeyStatistics", "assetProfile", "summaryDetail", "price")
+PROFILE_FETCH_TIMEOUT_SEC = 15
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _cache_get(cache: OrderedDict, key: Any, ttl: float) -> Any:
+    with _CACHE_LOCK:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    with _CACHE_LOCK:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+
+def _new_ticker(symbol: str) -> Any:
+    ticker = _load_yf().Ticker(symbol)
+    _cache_put(_TICKER_CACHE, symbol, ticker)
+    return ticker
+
+
+def _get_ticker(symbol: str, ttl: float = TICKER_CACHE_TTL_SEC) -> Any:
+    ticker = _cache_get(_TICKER_CACHE, symbol, ttl)
+    return ticker if ticker is not None else _new_ticker(symbol)
+
+
+def _cached_info(symbol: str, ttl: float = INFO_CACHE_TTL_SEC) -> Dict[str, Any]:
+    info = _cache_get(_INFO_CACHE, symbol, ttl)
+    if info is None:
+        # A Ticker memoizes .info for its lifetime, so a refresh needs a new one
+        info = dict(_new_ticker(symbol).info or {})
+        if info:
+            _cache_put(_INFO_CACHE, symbol, info)
+    return dict(info)
+
+
+def _fetch_profile(symbol: str) -> Dict[str, Any]:
+    """One quoteSummary request for PROFILE_MODULES, flattened like .info; {} if Yahoo refuses it."""
+    try:
+        from yfinance.data import YfData  # shares yfinance's session, cookie and crumb
+    except ImportError:
+        return {}
+    response = YfData().get(
+        _QUOTE_SUMMARY_URL + quote(symbol, safe=""),
+        params={"modules": ",".join(PROFILE_MODULES), "formatted": "false", "corsDomain": "finance.yahoo.com"},
+        timeout=PROFILE_FETCH_TIMEOUT_SEC,
+    )
+    if response.status_code >= 400:
+        return {}
+    results = (_json_loads(response.content).get("quoteSummary") or {}).get("result") or []
+    if not results:
+        return {}
+    profile: Dict[str, Any] = {}
+    for module in PROFILE_MODULES:
+        for key, value in (results[0].get(module) or {}).items():
+            if isinstance(value, dict) and "raw" in value:
+                value = value["raw"]
+            elif isinstance(value, str):
+                value = value.replace("\xa0", " ")
+            if value is not None:
+                profile[key] = value
+    profile["symbol"] = symbol
+    return profile
+
+
+def _cached_profile(symbol: str, ttl: float = INFO_CACHE_TTL_SEC) -> Dict[str, Any]:
+    profile = _cache_get(_PROFILE_CACHE, symbol, ttl)
+    if profile is None:
+        try:
+            profile = _fetch_profile(symbol)
+        except Exception:
+            profile = {}
+        if not profile:
+            profile = _cached_info(symbol)  # full .info as the fallback
+        if profile:
+            _cache_put(_PROFILE_CACHE, symbol, profile)
+    return dict(profile)
+
+
+def _fast_field(info: Any, key: str) -> Any:
+    """Read one fast_info field; None (not falsy) means missing, so a 0.0 price survives."""
+    try:
+        value = getattr(info, key, None)
+        if value is None and isinstance(info, dict):
+            value = info.get(key)
+        return value
+    except Exception:
+        return None  # fast_info raises for symbols it can't resolve
+
+
+def _cached_fast_info(symbol: str, ttl: float = INFO_CACHE_TTL_SEC) -> Dict[str, Any]:
+    snapshot = _cache_get(_FAST_INFO_CACHE, symbol, ttl)
+    if snapshot is None:
+        t = _new_ticker(symbol)
+        info = t.fast_info if hasattr(t, "fast_info") else {}
+        snapshot = {"last_price": _fast_field(info, "last_price"), "currency": _fast_field(info, "currency")}
+        _cache_put(_FAST_INFO_CACHE, symbol, snapshot)
+    return dict(snapshot)
+
+
+def _cached_quote_attr(symbol: str, attr: str, ttl: float = INFO_CACHE_TTL_SEC) -> Any:
+    """Ticker attribute such as .news or .recommendations, cached for the quote TTL.
+
+    A Ticker memoizes these for its lifetime, so a refresh needs a new one rather
+    than the long-lived Ticker from _get_ticker. Callers must not mutate the value.
+    """
+    key = (symbol, attr)
+    value = _cache_get(_QUOTE_ATTR_CACHE, key, ttl)
+    if value is None:
+        value = getattr(_new_ticker(symbol), attr)
+        if _is_empty(value) if hasattr(value, "shape") else not value:
+            return value
+        _cache_put(_QUOTE_ATTR_CACHE, key, value)
+    return value
+
+
+def _cached_history(symbol: str, period: str, interval: str, ttl: float = HISTORY_CACHE_TTL_SEC) -> Any:
+    """History DataFrame for (symbol, period, interval); callers get a shallow copy and must not mutate values."""
+    key = (symbol, period, interval)
+    hist = _cache_get(_HIST_CACHE, key, ttl)
+    if hist is None:
+        hist = _get_ticker(symbol).history(period=period, interval=interval)
+        if _is_empty(hist):
+            return hist
+        _cache_put(_HIST_CACHE, key, hist)
+    return hist.copy(deep=False)
+
+
+SMA_WINDOWS = (20, 50, 200)
+_sma_multi = None
+
+
+def _sma_multi_np(arr, windows):
+    """Trailing mean of the last k closes for each k in windows (NaN if the series is shorter)."""
+    import numpy as np
+
+    out = np.full(windows.size, np.nan)
+    n = arr.size
+    longest = int(windows.max()) if windows.size else 0
+    # Only the longest window's tail is read: running sums from the newest close backwards
+    sums = np.cumsum(arr[max(0, n - longest):][::-1])
+    for i, k in enumerate(windows.tolist()):
+        if 0 < k <= n:
+            out[i] = sums[k - 1] / k
+    return out
+
+
+def _build_sma_kernel(numba):
+    import numpy as np
+
+    # Eager signature: compiled when built, not on the first call. No cache=True: numba's on-disk
+    # cache records the importing module's name, and this file is loaded under several names.
+    # The input is typed read-only because pandas may hand back a read-only view of the column;
+    # writable arrays match it too.
+    @numba.njit(
+        numba.types.float64[:](
+            numba.types.Array(numba.types.float64, 1, "A", readonly=True),
+            numba.types.Array(numba.types.int64, 1, "A"),
+        ),
+    )
+    def _sma_multi_nb(arr, windows):
+        out = np.full(windows.size, np.nan)
+        n = arr.size
+        longest = 0
+        for w in range(windows.size):
+            longest = max(longest, windows[w])
+        total = 0.0
+        for j in range(min(longest, n)):
+            total += arr[n - 1 - j]
+            for w in range(windows.size):
+                if windows[w] == j + 1:
+                    out[w] = total / (j + 1)
+        return out
+
+    return _sma_multi_nb
+
+
+def _load_sma_kernel():
+    """The Numba SMA kernel when numba is installed, else the NumPy version; built on first use."""
+    global _sma_multi
+    if _sma_multi is None:
+        kernel = _sma_multi_np
+        try:
+            import numba
+            import numpy as np
+
+            candidate = _build_sma_kernel(numba)
+            candidate(np.zeros(1), np.array(SMA_WINDOWS, dtype=np.int64))  # fail here, not per call
+            kernel = candidate
+        except Exception:
+            pass  # numba is optional; the NumPy version gives the same results
+        _sma_multi = kernel
+    return _sma_multi
+
+
+def _trailing_smas(close) -> Dict[str, Optional[float]]:
+    """{"SMA20": ..., ...} for a float64 close array; one running-sum pass serves every window."""
+    import numpy as np
+
+    means = _load_sma_kernel()(close, np.array(SMA_WINDOWS, dtype=np.int64)).tolist()
+    return {f"SMA{k}": (None if v != v else float(v)) for k, v in zip(SMA_WINDOWS, means)}
+
+
+def _is_empty(frame: Any) -> bool:
+    """True for None, non-frames and frames without rows or columns (one shape read, like DataFrame.empty)."""
+    return 0 in getattr(frame, "shape", (0,))
 
 
 def _now_iso() -> str:
     return _dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
 
+def _iso_dates(index) -> List[str]:
+    """ISO-8601 timestamps (seconds precision, offset kept) for a DatetimeIndex.
+
+    Same strings as ``ts.replace(microsecond=0).isoformat()`` per row, but the wall-clock
+    part is formatted by NumPy in one call and only the distinct UTC offsets are formatted in Python.
+    """
+    import numpy as np
+
+    if index.tz is None:
+        return np.datetime_as_string(index.to_numpy().astype("datetime64[s]")).tolist()
+    local = index.tz_localize(None).to_numpy().astype("datetime64[s]")
+    utc = index.tz_convert("UTC").tz_localize(None).to_numpy().astype("datetime64[s]")
+    offsets = (local - utc).astype("int64").tolist()
+    labels = {}
+    for offset in set(offsets):
+        hours, minutes = divmod(abs(offset) // 60, 60)
+        labels[offset] = f"{'-' if offset < 0 else '+'}{hours:02d}:{minutes:02d}"
+    return [wall + labels[offset] for wall, offset in zip(np.datetime_as_string(local).tolist(), offsets)]
+
+
+def _float_column(frame, name: str) -> List[float]:
+    return frame[name].astype("float64").tolist() if name in frame.columns else [0.0] * len(frame)
+
+
+def _str_column(frame, name: str) -> List[str]:
+    # str() per value rather than astype(str), which leaves missing values as NaN on newer pandas
+    return [str(v) for v in frame[name].tolist()] if name in frame.columns else [""] * len(frame)
+
+
 class YFinanceTool:
     """
     Microsoft Agent Framework (MAF) compatible Yahoo Finance tool.
 
     Exposes read-only function tools:
       - get_current_stock_price
+      - get_current_stock_prices
       - get_company_info
       - get_stock_fundamentals
       - get_historical_stock_prices
@@ -29,9 +320,16 @@ class YFinanceTool:
       - get_company_news
       - get_technical_indicators
 
+    With ``async_io=True``, as_tools() returns coroutine variants that run the
+    blocking yfinance calls in worker threads, plus aget_stock_snapshot, which
+    fetches price, profile and fundamentals concurrently.
+
     Notes:
       - Returns small, structured dicts (ok, data, error).
       - Caps rows for history/news to avoid huge payloads.
+      - Tickers and .info/.fast_info/news/recommendation lookups are cached
+        process-wide; quote data expires after INFO_CACHE_TTL_SEC (env: YFINANCE_INFO_CACHE_TTL_SEC), price
+        history after HISTORY_CACHE_TTL_SEC.
       - Suitable for use inside your 5-Whys discovery/domain steps.
 
     Usage:
@@ -48,9 +346,10 @@ class YFinanceTool:
         # await agent.run("Get the last close and 1-month history for NESN.SW, and cite the numbers.")
     """
 
-    def __init__(self, history_row_cap: int = 500, news_cap: int = 10):
+    def __init__(self, history_row_cap: int = 500, news_cap: int = 10, async_io: bool = False):
         self.history_row_cap = max(1, int(history_row_cap))
         self.news_cap = max(1, int(news_cap))
+        self.async_io = bool(async_io)
 
     # -------------------------
     #  TOOLS (callables)
@@ -62,17 +361,17 @@ class YFinanceTool:
     ) -> Dict[str, Any]:
         """Fetch current/regular market price."""
         try:
-            t = yf.Ticker(symbol)
-            info = t.fast_info if hasattr(t, "fast_info") else {}
-            # Prefer fast_info; fallback to .info
-            price = getattr(info, "last_price", None) or info.get("last_price")
-            currency = getattr(info, "currency", None) or info.get("currency")
+            # fast_info only needs the light chart request, never the full .info quote payload
+            fast = _cached_fast_info(symbol)
+            price = fast["last_price"]
+            currency = fast["currency"]
 
             if price is None:
-                # fallback to info (slower)
-                i = t.info
-                price = i.get("regularMarketPrice", i.get("currentPrice"))
-                currency = i.get("currency", currency or "USD")
+                # fallback to the latest daily close
+                hist = _cached_history(symbol, "1d", "1d")
+                if not _is_empty(hist):
+                    close = hist["Close"].dropna()
+                    price = close.iloc[-1] if not close.empty else None
 
             if price is None:
                 return {"ok": False, "symbol": symbol, "error": "Price unavailable"}
@@ -87,13 +386,43 @@ class YFinanceTool:
         except Exception as e:
             return {"ok": False, "symbol": symbol, "error": str(e)}
 
+    def get_current_stock_prices(
+        self,
+        symbols: Annotated[List[str], Field(min_length=1, max_length=100, description="Ticker symbols, e.g., ['MSFT', 'NESN.SW'].")],
+    ) -> Dict[str, Any]:
+        """Latest price for several symbols, fetched in one batched download."""
+        symbols = list(dict.fromkeys(s.strip() for s in symbols if s and s.strip()))
+        if not symbols:
+            return {"ok": False, "symbols": symbols, "error": "No symbols given"}
+        try:
+            # yfinance fetches the symbols in parallel and returns one (symbol, field) column frame
+            data = _load_yf().download(symbols, period="1d", interval="1m", threads=True, progress=False, group_by="ticker")
+            if _is_empty(data):
+                return {"ok": False, "symbols": symbols, "error": "Prices unavailable"}
+            if data.columns.nlevels > 1:
+                closes = data.xs("Close", level=1, axis=1)
+            else:
+                closes = data[["Close"]].set_axis(symbols[:1], axis=1)
+            last = closes.ffill().iloc[-1]
+            prices: Dict[str, float] = {}
+            missing: List[str] = []
+            for symbol in symbols:
+                value = last.get(symbol)
+                if value is None or value != value:  # absent or NaN
+                    missing.append(symbol)
+                else:
+                    prices[symbol] = float(value)
+            return {"ok": bool(prices), "prices": prices, "missing": missing, "as_of": _now_iso()}
+        except Exception as e:
+            return {"ok": False, "symbols": symbols, "error": str(e)}
+
     def get_company_info(
         self,
         symbol: Annotated[str, Field(description="Ticker symbol.")],
     ) -> Dict[str, Any]:
         """Fetch general company profile/metadata."""
         try:
-            info = yf.Ticker(symbol).info
+            info = _cached_profile(symbol)
             if not info:
                 return {"ok": False, "symbol": symbol, "error": "Info unavailable"}
             data = {
@@ -139,7 +468,7 @@ class YFinanceTool:
     ) -> Dict[str, Any]:
         """Key fundamentals snapshot (compact)."""
         try:
-            info = yf.Ticker(symbol).info
+            info = _cached_profile(symbol)
             if not info:
                 return {"ok": False, "symbol": symbol, "error": "Fundamentals unavailable"}
             fundamentals = {
@@ -169,24 +498,27 @@ class YFinanceTool:
     ) -> Dict[str, Any]:
         """Historical OHLCV with a row cap."""
         try:
-            hist = yf.Ticker(symbol).history(period=period, interval=interval)
-            if hist is None or hist.empty:
+            hist = _cached_history(symbol, period, interval)
+            if _is_empty(hist):
                 return {"ok": False, "symbol": symbol, "error": "No history"}
 
             hist = hist.tail(self.history_row_cap)
-            rows = []
-            for idx, row in hist.iterrows():
-                dt = idx.to_pydatetime().replace(microsecond=0).isoformat()
-                rows.append(
-                    {
-                        "date": dt,
-                        "open": float(row.get("Open", 0.0)),
-                        "high": float(row.get("High", 0.0)),
-                        "low": float(row.get("Low", 0.0)),
-                        "close": float(row.get("Close", 0.0)),
-                        "volume": int(row.get("Volume", 0)) if not (row.get("Volume") != row.get("Volume")) else 0,  # NaN-safe
-                    }
+            # Read each column once instead of boxing a Series per row
+            if "Volume" in hist.columns:
+                volumes = hist["Volume"].fillna(0).astype("int64").tolist()  # NaN-safe
+            else:
+                volumes = [0] * len(hist)
+            rows = [
+                {"date": date, "open": o, "high": h, "low": l, "close": c, "volume": v}
+                for date, o, h, l, c, v in zip(
+                    _iso_dates(hist.index),
+                    _float_column(hist, "Open"),
+                    _float_column(hist, "High"),
+                    _float_column(hist, "Low"),
+                    _float_column(hist, "Close"),
+                    volumes,
                 )
+            ]
             return {"ok": True, "symbol": symbol, "period": period, "interval": interval, "count": len(rows), "data": rows}
         except Exception as e:
             return {"ok": False, "symbol": symbol, "error": str(e)}
@@ -198,23 +530,21 @@ class YFinanceTool:
     ) -> Dict[str, Any]:
         """Analyst recommendations (if available)."""
         try:
-            recs = yf.Ticker(symbol).recommendations
-            if recs is None or recs.empty:
+            recs = _cached_quote_attr(symbol, "recommendations")
+            if _is_empty(recs):
                 return {"ok": False, "symbol": symbol, "error": "No recommendations"}
 
             recs = recs.tail(max_rows)
-            rows = []
-            for idx, row in recs.iterrows():
-                dt = idx.to_pydatetime().replace(microsecond=0).isoformat()
-                rows.append(
-                    {
-                        "date": dt,
-                        "firm": str(row.get("Firm", "")),
-                        "to_grade": str(row.get("To Grade", "")),
-                        "from_grade": str(row.get("From Grade", "")),
-                        "action": str(row.get("Action", "")),
-                    }
+            rows = [
+                {"date": date, "firm": firm, "to_grade": to_grade, "from_grade": from_grade, "action": action}
+                for date, firm, to_grade, from_grade, action in zip(
+                    _iso_dates(recs.index),
+                    _str_column(recs, "Firm"),
+                    _str_column(recs, "To Grade"),
+                    _str_column(recs, "From Grade"),
+                    _str_column(recs, "Action"),
                 )
+            ]
             return {"ok": True, "symbol": symbol, "count": len(rows), "data": rows}
         except Exception as e:
             return {"ok": False, "symbol": symbol, "error": str(e)}
@@ -226,7 +556,7 @@ class YFinanceTool:
     ) -> Dict[str, Any]:
         """Recent company news headlines with links."""
         try:
-            news = yf.Ticker(symbol).news or []
+            news = _cached_quote_attr(symbol, "news") or []
             items = []
             for n in news[: min(self.news_cap, num_stories)]:
                 items.append(
@@ -249,24 +579,103 @@ class YFinanceTool:
     ) -> Dict[str, Any]:
         """Simple technical aggregates (SMA20/50/200) on close, capped."""
         try:
-            hist = yf.Ticker(symbol).history(period=period, interval="1d")
-            if hist is None or hist.empty:
+            hist = _cached_history(symbol, period, "1d")
+            if _is_empty(hist):
                 return {"ok": False, "symbol": symbol, "error": "No history"}
 
-            close = hist["Close"].dropna()
-            def _sma(series, n):
-                return float(series.tail(n).mean()) if len(series) >= n else None
+            close = hist["Close"].dropna().to_numpy(dtype="float64")
 
             indicators = {
-                "SMA20": _sma(close, 20),
-                "SMA50": _sma(close, 50),
-                "SMA200": _sma(close, 200),
-                "last_close": float(close.iloc[-1]) if not close.empty else None,
+                **_trailing_smas(close),
+                "last_close": float(close[-1]) if close.size else None,
             }
             return {"ok": True, "symbol": symbol, "data": indicators}
         except Exception as e:
             return {"ok": False, "symbol": symbol, "error": str(e)}
 
+    # -------------------------
+    #  Async variants (blocking yfinance work runs in a worker thread)
+    # -------------------------
+
+    async def aget_current_stock_price(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol, e.g., 'MSFT', 'NESN.SW'.")],
+    ) -> Dict[str, Any]:
+        """Fetch current/regular market price."""
+        return await asyncio.to_thread(self.get_current_stock_price, symbol)
+
+    async def aget_current_stock_prices(
+        self,
+        symbols: Annotated[List[str], Field(min_length=1, max_length=100, description="Ticker symbols, e.g., ['MSFT', 'NESN.SW'].")],
+    ) -> Dict[str, Any]:
+        """Latest price for several symbols, fetched in one batched download."""
+        return await asyncio.to_thread(self.get_current_stock_prices, symbols)
+
+    async def aget_company_info(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol.")],
+    ) -> Dict[str, Any]:
+        """Fetch general company profile/metadata."""
+        return await asyncio.to_thread(self.get_company_info, symbol)
+
+    async def aget_stock_fundamentals(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol.")],
+    ) -> Dict[str, Any]:
+        """Key fundamentals snapshot (compact)."""
+        return await asyncio.to_thread(self.get_stock_fundamentals, symbol)
+
+    async def aget_historical_stock_prices(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol.")],
+        period: Annotated[str, Field(description="1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max")] = "1mo",
+        interval: Annotated[str, Field(description="1d,5d,1wk,1mo,3mo")] = "1d",
+    ) -> Dict[str, Any]:
+        """Historical OHLCV with a row cap."""
+        return await asyncio.to_thread(self.get_historical_stock_prices, symbol, period, interval)
+
+    async def aget_analyst_recommendations(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol.")],
+        max_rows: Annotated[int, Field(ge=1, le=1000, description="Cap result rows.")] = 100,
+    ) -> Dict[str, Any]:
+        """Analyst recommendations (if available)."""
+        return await asyncio.to_thread(self.get_analyst_recommendations, symbol, max_rows)
+
+    async def aget_company_news(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol.")],
+        num_stories: Annotated[int, Field(ge=1, le=50, description="Max number of stories to return.")] = 5,
+    ) -> Dict[str, Any]:
+        """Recent company news headlines with links."""
+        return await asyncio.to_thread(self.get_company_news, symbol, num_stories)
+
+    async def aget_technical_indicators(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol.")],
+        period: Annotated[str, Field(description="1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max")] = "3mo",
+    ) -> Dict[str, Any]:
+        """Simple technical aggregates (SMA20/50/200) on close, capped."""
+        return await asyncio.to_thread(self.get_technical_indicators, symbol, period)
+
+    async def aget_stock_snapshot(
+        self,
+        symbol: Annotated[str, Field(description="Ticker symbol.")],
+    ) -> Dict[str, Any]:
+        """Current price, company profile and fundamentals, fetched concurrently."""
+        price, info, fundamentals = await asyncio.gather(
+            self.aget_current_stock_price(symbol),
+            self.aget_company_info(symbol),
+            self.aget_stock_fundamentals(symbol),
+        )
+        return {
+            "ok": price["ok"] or info["ok"] or fundamentals["ok"],
+            "symbol": symbol,
+            "price": price,
+            "company_info": info,
+            "fundamentals": fundamentals,
+        }
+
     # -------------------------
     #  MAF integration helper
     # -------------------------
@@ -287,8 +696,21 @@ class YFinanceTool:
             )
             # await agent.run("Get the last close and 1-month history for NESN.SW, and cite the numbers.")
         """
+        if self.async_io:
+            return [
+                self.aget_current_stock_price,
+                self.aget_current_stock_prices,
+                self.aget_company_info,
+                self.aget_stock_fundamentals,
+                self.aget_historical_stock_prices,
+                self.aget_analyst_recommendations,
+                self.aget_company_news,
+                self.aget_technical_indicators,
+                self.aget_stock_snapshot,
+            ]
         return [
             self.get_current_stock_price,
+            self.get_current_stock_prices,
             self.get_company_info,
             self.get_stock_fundamentals,
             self.get_historical_stock_prices,
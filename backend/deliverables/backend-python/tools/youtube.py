@@ -1,19 +1,51 @@
 """YouTube utility tools for Microsoft Agent Framework."""
 from __future__ import annotations
 
+import functools
 import json
-from typing import Dict, Optional, List
+import re
+from typing import Any, Dict, Optional, List
 from urllib.parse import parse_qs, urlparse
-from urllib.request import urlopen
+
+import requests
+from requests.adapters import HTTPAdapter
 from typing_extensions import Annotated
 from pydantic import Field
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 SAMPLE_PROMPTS = [
     "Get the metadata for https://www.youtube.com/watch?v=dQw4w9WgXcQ and summarise the title.",
     "Fetch captions for this training recording and highlight the top moments.",
     "Generate timestamp bullets for the latest all-hands video.",
 ]
 
+OEMBED_URL = "https://www.youtube.com/oembed"
+OEMBED_TIMEOUT_SEC = 10
+
+# Fast path for the common URL shapes; anything else falls back to urlparse in _video_id
+_VIDEO_ID_RE = re.compile(
+    r"^https?://(?:[\w-]+\.)*(?:youtube\.com/(?:watch\?(?:[^#]*?&)?v=|embed/|v/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})(?=$|[?&#/])"
+)
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _build_session() -> requests.Session:
+    """Keep-alive session for oEmbed lookups, shared across YouTubeTool instances."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=10))
+    return session
+
+
+_HTTP = _build_session()
+
 
 class YouTubeTool:
     REQUIRED_SECRETS: List[str] = []
@@ -38,7 +70,11 @@ class YouTubeTool:
     # Helpers
     # ------------------------------------------------------------------ #
     @staticmethod
+    @functools.lru_cache(maxsize=2048)
     def _video_id(url: str) -> Optional[str]:
+        match = _VIDEO_ID_RE.match(url)
+        if match:
+            return match.group(1)
         parsed = urlparse(url)
         host = parsed.hostname or ""
         if host == "youtu.be":
@@ -61,19 +97,19 @@ class YouTubeTool:
         if not video_id:
             return {"ok": False, "error": "Unable to extract video id from url."}
 
-        endpoint = "https://www.youtube.com/oembed"
-        params = f"format=json&url=https://www.youtube.com/watch?v={video_id}"
+        params = {"format": "json", "url": f"https://www.youtube.com/watch?v={video_id}"}
         try:
-            with urlopen(f"{endpoint}?{params}") as response:
-                data = json.loads(response.read().decode())
-                metadata = {
-                    "title": data.get("title"),
-                    "author_name": data.get("author_name"),
-                    "author_url": data.get("author_url"),
-                    "provider_name": data.get("provider_name"),
-                    "thumbnail_url": data.get("thumbnail_url"),
-                }
-                return {"ok": True, "video": metadata}
+            response = _HTTP.get(OEMBED_URL, params=params, timeout=OEMBED_TIMEOUT_SEC)
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            metadata = {
+                "title": data.get("title"),
+                "author_name": data.get("author_name"),
+                "author_url": data.get("author_url"),
+                "provider_name": data.get("provider_name"),
+                "thumbnail_url": data.get("thumbnail_url"),
+            }
+            return {"ok": True, "video": metadata}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to fetch metadata: {exc}"}
 
@@ -95,7 +131,13 @@ class YouTubeTool:
             transcript = self._transcript_api.fetch(video_id, **kwargs)
             if not transcript:
                 return {"ok": False, "error": "No captions available."}
-            text = " ".join(chunk["text"] for chunk in transcript if chunk.get("text"))
+            snippets = getattr(transcript, "snippets", None)
+            if snippets is not None:
+                # youtube-transcript-api >= 1.0 returns a FetchedTranscript of snippet objects
+                parts = [snippet.text for snippet in snippets if snippet.text]
+            else:
+                parts = [chunk["text"] for chunk in transcript if chunk.get("text")]
+            text = " ".join(parts)
             return {"ok": True, "captions": text}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to fetch captions: {exc}"}
@@ -118,11 +160,15 @@ class YouTubeTool:
             transcript = self._transcript_api.fetch(video_id, **kwargs)
             if not transcript:
                 return {"ok": False, "error": "No captions available for timestamps."}
-            stamps = []
-            for item in transcript:
-                start = int(item.get("start", 0))
-                minutes, seconds = divmod(start, 60)
-                stamps.append(f"{minutes}:{seconds:02d} - {item.get('text', '').strip()}")
+            snippets = getattr(transcript, "snippets", None)
+            if snippets is not None:
+                items = [(snippet.start, snippet.text) for snippet in snippets]
+            else:
+                items = [(item.get("start", 0), item.get("text", "")) for item in transcript]
+            stamps = [
+                f"{start // 60}:{start % 60:02d} - {(text or '').strip()}"
+                for start, text in ((int(start), text) for start, text in items)
+            ]
             return {"ok": True, "timestamps": stamps}
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": f"Failed to build timestamps: {exc}"}